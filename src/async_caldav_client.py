@@ -0,0 +1,1247 @@
+"""
+Async Calendar Client for MCP Calendar Application
+Talks to the calendar over a pooled httpx.AsyncClient so that many CRUD
+operations can be awaited concurrently.
+"""
+
+import asyncio
+import functools
+import logging
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from typing import Dict, Any, AsyncIterator, Optional, List, Tuple
+from urllib.parse import urljoin
+
+import httpx
+import icalendar
+
+from caldav.lib.error import AuthorizationError, NotFoundError
+
+from caldav_client import (
+    COMPONENTS,
+    MAX_CONCURRENCY,
+    READ_FIELDS,
+    first_component,
+    href_to_id,
+    journal_to_ical,
+    patch_ical,
+    read_fields,
+    require_connected,
+)
+from etag_cache import ETagCache
+from models.base_model import intern_status, new_id
+from models.event import Event
+from models.ical_format import calendar_document, format_floating
+from models.todo import Todo
+
+logger = logging.getLogger(__name__)
+
+DAV_NS = "DAV:"
+CALDAV_NS = "urn:ietf:params:xml:ns:caldav"
+
+_PRINCIPAL_BODY = (
+    '<?xml version="1.0" encoding="utf-8"?>'
+    '<d:propfind xmlns:d="DAV:"><d:prop><d:current-user-principal/></d:prop>'
+    "</d:propfind>"
+)
+
+_HOME_SET_BODY = (
+    '<?xml version="1.0" encoding="utf-8"?>'
+    '<d:propfind xmlns:d="DAV:" xmlns:c="urn:ietf:params:xml:ns:caldav">'
+    "<d:prop><c:calendar-home-set/></d:prop></d:propfind>"
+)
+
+_CALENDARS_BODY = (
+    '<?xml version="1.0" encoding="utf-8"?>'
+    '<d:propfind xmlns:d="DAV:"><d:prop><d:resourcetype/><d:displayname/>'
+    "</d:prop></d:propfind>"
+)
+
+_QUERY_BODY = (
+    '<?xml version="1.0" encoding="utf-8"?>'
+    '<c:calendar-query xmlns:d="DAV:" xmlns:c="urn:ietf:params:xml:ns:caldav">'
+    "<d:prop><d:getetag/><c:calendar-data/></d:prop>"
+    '<c:filter><c:comp-filter name="VCALENDAR"><c:comp-filter name="{component}">'
+    "{inner}</c:comp-filter></c:comp-filter></c:filter></c:calendar-query>"
+)
+
+_MULTIGET_BODY = (
+    '<?xml version="1.0" encoding="utf-8"?>'
+    '<c:calendar-multiget xmlns:d="DAV:" xmlns:c="urn:ietf:params:xml:ns:caldav">'
+    "<d:prop><d:getetag/><c:calendar-data/></d:prop>{hrefs}</c:calendar-multiget>"
+)
+
+_SYNC_BODY = (
+    '<?xml version="1.0" encoding="utf-8"?>'
+    '<d:sync-collection xmlns:d="DAV:"><d:sync-token>{token}</d:sync-token>'
+    "<d:sync-level>1</d:sync-level><d:prop><d:getetag/></d:prop>"
+    "</d:sync-collection>"
+)
+
+_TIME_RANGE_FILTER = "<c:time-range{bounds}/>"
+
+_UID_FILTER = (
+    '<c:prop-filter name="UID"><c:text-match collation="i;octet">{uid}'
+    "</c:text-match></c:prop-filter>"
+)
+
+
+def _tag(namespace: str, name: str) -> str:
+    """Build a Clark-notation XML tag."""
+    return f"{{{namespace}}}{name}"
+
+
+_RESPONSE_TAG = _tag(DAV_NS, "response")
+
+
+def _utc_stamp(dt: datetime) -> str:
+    """Format a datetime as an RFC 5545 UTC timestamp."""
+    return format_floating(dt.astimezone(timezone.utc)) + "Z"
+
+
+def _time_range(start: Optional[datetime], end: Optional[datetime]) -> str:
+    """
+    Build the time-range filter for a calendar-query.
+
+    Either bound may be omitted to leave that side of the range open.
+
+    Args:
+        start: Inclusive start of the range
+        end: Exclusive end of the range
+
+    Returns:
+        Filter XML, or an empty string when no range was requested
+    """
+    bounds = ""
+    if start is not None:
+        bounds += f' start="{_utc_stamp(start)}"'
+    if end is not None:
+        bounds += f' end="{_utc_stamp(end)}"'
+    return _TIME_RANGE_FILTER.format(bounds=bounds) if bounds else ""
+
+
+def _escape(text: str) -> str:
+    """Escape text for inclusion in an XML body."""
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _response_entry(response) -> Optional[Dict[str, Any]]:
+    """
+    Extract the successful properties of one multistatus response element.
+
+    Args:
+        response: {DAV:}response element
+
+    Returns:
+        Dictionary with href, etag, calendar_data and the raw prop element,
+        or None if the response carried no 200 propstat
+    """
+    prop = None
+    for propstat in response.iter(_tag(DAV_NS, "propstat")):
+        status = propstat.findtext(_tag(DAV_NS, "status"), default="")
+        if " 200 " in status:
+            prop = propstat.find(_tag(DAV_NS, "prop"))
+            break
+    if prop is None:
+        return None
+    return {
+        "href": response.findtext(_tag(DAV_NS, "href"), default=""),
+        "etag": prop.findtext(_tag(DAV_NS, "getetag")),
+        "calendar_data": prop.findtext(_tag(CALDAV_NS, "calendar-data")),
+        "prop": prop,
+    }
+
+
+def _parse_multistatus(content: bytes) -> List[Dict[str, Any]]:
+    """
+    Parse a WebDAV multistatus document.
+
+    Args:
+        content: Raw response body
+
+    Returns:
+        List of dictionaries with href, etag, calendar_data and the raw prop element
+    """
+    root = ET.fromstring(content)
+    responses = []
+    for response in root.iter(_tag(DAV_NS, "response")):
+        entry = _response_entry(response)
+        if entry is not None:
+            responses.append(entry)
+    return responses
+
+
+def _drain_responses(parser: ET.XMLPullParser) -> List[Dict[str, Any]]:
+    """
+    Collect the responses completed so far by a streaming multistatus parser.
+
+    Each response element is cleared once read so memory stays bounded by a
+    single response rather than the whole document.
+
+    Args:
+        parser: XMLPullParser fed with the response body
+
+    Returns:
+        List of dictionaries with href, etag and calendar_data
+    """
+    entries = []
+    for _, element in parser.read_events():
+        if element.tag != _RESPONSE_TAG:
+            continue
+        entry = _response_entry(element)
+        if entry is not None:
+            del entry["prop"]
+            entries.append(entry)
+        element.clear()
+    return entries
+
+
+def _parse_sync_collection(content: bytes) -> Tuple[str, List[Dict[str, Any]]]:
+    """
+    Parse a sync-collection REPORT response.
+
+    Args:
+        content: Raw response body
+
+    Returns:
+        Tuple of (new sync token, list of dicts with href, etag and deleted)
+    """
+    root = ET.fromstring(content)
+    changes = []
+    for response in root.iter(_tag(DAV_NS, "response")):
+        # Removed members carry a 404 status directly on the response
+        status = response.findtext(_tag(DAV_NS, "status"), default="")
+        changes.append(
+            {
+                "href": response.findtext(_tag(DAV_NS, "href"), default=""),
+                "etag": response.findtext(f".//{_tag(DAV_NS, 'getetag')}"),
+                "deleted": " 404 " in status,
+            }
+        )
+    return root.findtext(_tag(DAV_NS, "sync-token"), default=""), changes
+
+
+def _first_component(ical_str: str, name: str):
+    """
+    Return the first component of the given type in an iCalendar string.
+
+    Args:
+        ical_str: iCalendar string
+        name: Component name (VEVENT, VTODO, VJOURNAL)
+
+    Returns:
+        icalendar component or None
+    """
+    return first_component(icalendar.Calendar.from_ical(ical_str), name)
+
+
+def _component_to_event(component) -> Event:
+    """
+    Convert a VEVENT component to an Event object.
+
+    Args:
+        component: icalendar VEVENT component
+
+    Returns:
+        Event object
+    """
+    get = component.get
+    attendees = get("attendee", [])
+    if not isinstance(attendees, list):
+        attendees = [attendees]
+
+    dtstart = get("dtstart")
+    dtend = get("dtend")
+    return Event(
+        id=str(get("uid", "")),
+        title=str(get("summary", "")),
+        description=str(get("description", "")),
+        start_time=dtstart.dt if dtstart else None,
+        end_time=dtend.dt if dtend else None,
+        location=str(get("location", "")),
+        attendees=[str(a) for a in attendees],
+        status=intern_status(get("status", "")),
+        rrule=get("rrule"),
+    )
+
+
+def _component_to_todo(component) -> Todo:
+    """
+    Convert a VTODO component to a Todo object.
+
+    Args:
+        component: icalendar VTODO component
+
+    Returns:
+        Todo object
+    """
+    get = component.get
+    priority = get("priority")
+    due = get("due")
+    completed = get("completed")
+    return Todo(
+        id=str(get("uid", "")),
+        title=str(get("summary", "")),
+        description=str(get("description", "")),
+        due_date=due.dt if due else None,
+        completion_date=completed.dt if completed else None,
+        status=intern_status(get("status", "")),
+        priority=int(priority) if priority else 5,
+    )
+
+
+def _component_to_journal(component) -> Dict[str, Any]:
+    """
+    Convert a VJOURNAL component to a journal dictionary.
+
+    Args:
+        component: icalendar VJOURNAL component
+
+    Returns:
+        Dictionary containing journal data
+    """
+    journal_data = {
+        "id": str(component.get("uid", "")),
+        "title": "",
+        "description": "",
+        "date": None,
+        "status": "",
+    }
+    return read_fields(journal_data, component, READ_FIELDS["journal"])
+
+
+def _raise_for_status(response: httpx.Response) -> None:
+    """
+    Raise the matching caldav error for a failed response.
+
+    Args:
+        response: httpx response to check
+    """
+    request = response.request
+    if response.status_code in (401, 403):
+        raise AuthorizationError(
+            f"{request.method} {request.url}: {response.status_code}"
+        )
+    if response.status_code == 404:
+        raise NotFoundError(f"{request.method} {request.url}: 404")
+    response.raise_for_status()
+
+
+class AsyncCalDAVClient:
+    """Asynchronous client for connecting to and interacting with a calendar."""
+
+    def __init__(self, config_manager):
+        """
+        Initialize the async CalDAV client.
+
+        Args:
+            config_manager: Configuration manager instance
+        """
+        self.config_manager = config_manager
+        self._client: Optional[httpx.AsyncClient] = None
+        self.calendar_url: Optional[str] = None
+        self._cache = ETagCache()
+        self._sync_token = ""
+        self._hrefs: Dict[str, str] = {}
+        # Last-seen (etag, iCalendar text) per object, for If-Match updates
+        self._raw = ETagCache()
+        self._limit: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> "AsyncCalDAVClient":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.disconnect()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Return the pooled HTTP client, building it on first use.
+
+        Returns:
+            Shared httpx.AsyncClient instance
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                # Keep idle connections well past httpx's 5s default so that
+                # tool calls spaced out by a conversation reuse the TLS session
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=40,
+                    keepalive_expiry=60.0,
+                ),
+                auth=(
+                    self.config_manager.get("username"),
+                    self.config_manager.get("password"),
+                ),
+                verify=self.config_manager.get("use_ssl", True),
+            )
+        return self._client
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """
+        Issue an HTTP request and raise on error status codes.
+
+        Args:
+            method: HTTP or WebDAV method
+            url: Absolute target URL
+            body: Optional request body
+            headers: Optional extra request headers
+
+        Returns:
+            The httpx response
+        """
+        request_headers = {"Content-Type": "application/xml; charset=utf-8"}
+        if headers:
+            request_headers.update(headers)
+        response = await self._get_client().request(
+            method, url, content=body, headers=request_headers
+        )
+        _raise_for_status(response)
+        return response
+
+    async def _iter_report(self, body: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run a REPORT on the default calendar, yielding responses as they stream.
+
+        Each multistatus response is yielded as soon as it has been parsed,
+        so callers can convert and discard it before the reply has finished.
+
+        Args:
+            body: REPORT request body
+
+        Yields:
+            Parsed multistatus responses
+        """
+        parser = ET.XMLPullParser(events=("end",))
+        async with self._get_client().stream(
+            "REPORT",
+            self.calendar_url,
+            content=body,
+            headers={"Content-Type": "application/xml; charset=utf-8", "Depth": "1"},
+        ) as response:
+            _raise_for_status(response)
+            async for chunk in response.aiter_bytes():
+                parser.feed(chunk)
+                for entry in _drain_responses(parser):
+                    yield entry
+        parser.close()
+        for entry in _drain_responses(parser):
+            yield entry
+
+    async def _report(self, body: str) -> list:
+        """
+        Run a REPORT on the default calendar, parsing the reply as it streams.
+
+        Args:
+            body: REPORT request body
+
+        Returns:
+            List of parsed multistatus responses
+        """
+        return [entry async for entry in self._iter_report(body)]
+
+    async def _propfind(self, url: str, body: str, depth: str = "0") -> list:
+        """Issue a PROPFIND and return the parsed multistatus responses."""
+        response = await self._request("PROPFIND", url, body, {"Depth": depth})
+        return _parse_multistatus(response.content)
+
+    async def _discover_calendar(self) -> str:
+        """
+        Resolve the default calendar URL.
+
+        Returns:
+            The configured calendar URL, or the principal's first calendar
+        """
+        # A configured calendar needs no discovery round-trips
+        calendar_url = self.config_manager.get("calendar_url")
+        if calendar_url:
+            return calendar_url
+
+        server_url = self.config_manager.get("server_url")
+
+        # Discover principal, then calendar home, then the first calendar
+        responses = await self._propfind(server_url, _PRINCIPAL_BODY)
+        principal_href = responses[0]["prop"].findtext(
+            f"{_tag(DAV_NS, 'current-user-principal')}/{_tag(DAV_NS, 'href')}"
+        )
+        principal_url = urljoin(server_url, principal_href)
+
+        responses = await self._propfind(principal_url, _HOME_SET_BODY)
+        home_href = responses[0]["prop"].findtext(
+            f"{_tag(CALDAV_NS, 'calendar-home-set')}/{_tag(DAV_NS, 'href')}"
+        )
+        home_url = urljoin(principal_url, home_href)
+
+        responses = await self._propfind(home_url, _CALENDARS_BODY, depth="1")
+        for response in responses:
+            resourcetype = response["prop"].find(_tag(DAV_NS, "resourcetype"))
+            if (
+                resourcetype is not None
+                and resourcetype.find(_tag(CALDAV_NS, "calendar")) is not None
+            ):
+                # Keep the trailing slash urljoin needs to resolve object
+                # hrefs inside the collection
+                url = urljoin(home_url, response["href"])
+                return url if url.endswith("/") else url + "/"
+
+        raise Exception("No calendar found for the principal")
+
+    async def connect(self) -> bool:
+        """
+        Establish connection to the calendar and discover the default calendar.
+
+        Returns:
+            True if connection successful, False otherwise
+        """
+        try:
+            self.calendar_url = await self._discover_calendar()
+            logger.info("Successfully connected to the calendar")
+            return True
+        except Exception as e:
+            logger.error("Failed to connect to the calendar: %s", e)
+            self.calendar_url = None
+            raise  # Propagate the exception
+
+    @require_connected
+    async def refresh_calendars(self) -> None:
+        """
+        Re-resolve the default calendar, e.g. after calendars were added or
+        removed on the server. Cached objects, hrefs and the sync token are
+        dropped since they may belong to the previous calendar.
+        """
+        self.calendar_url = await self._discover_calendar()
+        self._cache.clear()
+        self._sync_token = ""
+        self._hrefs.clear()
+        self._raw.clear()
+        logger.info("Refreshed calendars")
+
+    async def disconnect(self) -> None:
+        """Close the connection to the calendar."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self.calendar_url = None
+        self._cache.clear()
+        self._sync_token = ""
+        self._hrefs.clear()
+        self._raw.clear()
+        logger.info("Disconnected from the calendar")
+
+    def is_connected(self) -> bool:
+        """
+        Check if client is connected.
+
+        Returns:
+            True if connected, False otherwise
+        """
+        return self.calendar_url is not None
+
+    async def _gather(self, coros, return_exceptions: bool = False) -> list:
+        """
+        Run coroutines concurrently, at most MAX_CONCURRENCY at a time.
+
+        Args:
+            coros: Coroutines to run
+            return_exceptions: Return exceptions as results instead of raising
+
+        Returns:
+            Results in input order
+        """
+        # Created on first use so it binds to the running event loop
+        if self._limit is None:
+            self._limit = asyncio.Semaphore(MAX_CONCURRENCY)
+
+        async def bounded(coro):
+            async with self._limit:
+                return await coro
+
+        return list(
+            await asyncio.gather(
+                *(bounded(coro) for coro in coros), return_exceptions=return_exceptions
+            )
+        )
+
+    async def _query(self, component: str, inner: str = "") -> list:
+        """
+        Run a calendar-query REPORT against the default calendar.
+
+        Args:
+            component: Component name to filter on (VEVENT, VTODO, VJOURNAL)
+            inner: Optional extra filter XML placed inside the component filter
+
+        Returns:
+            List of parsed multistatus responses
+        """
+        return await self._report(
+            _QUERY_BODY.format(component=component, inner=inner)
+        )
+
+    def _iter_query(
+        self, component: str, inner: str = ""
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a calendar-query REPORT against the default calendar.
+
+        Args:
+            component: Component name to filter on (VEVENT, VTODO, VJOURNAL)
+            inner: Optional extra filter XML placed inside the component filter
+
+        Returns:
+            Async iterator over parsed multistatus responses
+        """
+        return self._iter_report(_QUERY_BODY.format(component=component, inner=inner))
+
+    async def _multiget(self, uids: List[str]) -> list:
+        """
+        Fetch several calendar objects with one calendar-multiget REPORT.
+
+        Objects are addressed as ``<uid>.ics`` inside the default calendar,
+        which is how both this client and the caldav library name them.
+
+        Args:
+            uids: UIDs of the objects to fetch
+
+        Returns:
+            List of parsed multistatus responses for the objects that exist
+        """
+        hrefs = "".join(
+            f"<d:href>{_escape(urljoin(self.calendar_url, f'{uid}.ics'))}</d:href>"
+            for uid in uids
+        )
+        return await self._report(_MULTIGET_BODY.format(hrefs=hrefs))
+
+    async def _find_by_uid(self, component: str, uid: str) -> Dict[str, Any]:
+        """
+        Locate a calendar object by UID.
+
+        Args:
+            component: Component name (VEVENT, VTODO, VJOURNAL)
+            uid: UID of the object
+
+        Returns:
+            Parsed multistatus response for the object
+        """
+        responses = await self._query(component, _UID_FILTER.format(uid=_escape(uid)))
+        if not responses:
+            raise NotFoundError(f"{component} {uid} not found")
+        self._hrefs[uid] = responses[0]["href"]
+        return responses[0]
+
+    async def _locate(self, component: str, uid: str) -> Dict[str, Any]:
+        """
+        Fetch a calendar object, skipping the UID search when its href is known.
+
+        Args:
+            component: Component name (VEVENT, VTODO, VJOURNAL)
+            uid: UID of the object
+
+        Returns:
+            Dictionary with the object's href, etag and calendar data
+        """
+        href = self._hrefs.get(uid)
+        if href is None:
+            return await self._find_by_uid(component, uid)
+
+        response = await self._request("GET", urljoin(self.calendar_url, href))
+        return {
+            "href": href,
+            "etag": response.headers.get("ETag"),
+            "calendar_data": response.text,
+        }
+
+    async def _fetch_cached(
+        self, component: str, uid: str
+    ) -> Tuple[Any, Optional[str], Optional[str]]:
+        """
+        Fetch a calendar object, revalidating any cached copy by ETag.
+
+        Args:
+            component: Component name (VEVENT, VTODO, VJOURNAL)
+            uid: UID of the object
+
+        Returns:
+            Tuple of (cached value, calendar data, etag); the cached value is
+            set only when the server answered 304 Not Modified
+        """
+        cached = self._cache.get(uid)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        href = self._hrefs.get(uid, f"{uid}.ics")
+        response = await self._get_client().get(
+            urljoin(self.calendar_url, href), headers=headers
+        )
+
+        if response.status_code == 304 and cached:
+            return cached[1], None, None
+        if response.status_code == 200:
+            etag = response.headers.get("ETag")
+            if etag:
+                self._raw.put(uid, etag, response.text)
+            return None, response.text, etag
+
+        # Not stored under its UID; fall back to a UID search
+        found = await self._find_by_uid(component, uid)
+        return None, found["calendar_data"], found["etag"]
+
+    async def _put_patched(
+        self,
+        kind: str,
+        uid: str,
+        href: str,
+        etag: Optional[str],
+        ical: str,
+        data: Dict[str, Any],
+    ) -> httpx.Response:
+        """
+        PUT an object with field updates applied to the given copy of it.
+
+        Args:
+            kind: Object kind (event, journal or todo)
+            uid: UID of the object
+            href: Object href, relative to the calendar
+            etag: ETag of the copy; sent as If-Match when set
+            ical: iCalendar text of the copy
+            data: Dictionary containing updated values
+
+        Returns:
+            The httpx response; the caller checks its status
+        """
+        body = patch_ical(ical, kind, data)
+        headers = {"Content-Type": "text/calendar; charset=utf-8"}
+        if etag:
+            headers["If-Match"] = etag
+        response = await self._get_client().put(
+            urljoin(self.calendar_url, href), content=body, headers=headers
+        )
+        new_etag = response.headers.get("ETag")
+        if response.is_success and new_etag:
+            self._raw.put(uid, new_etag, body)
+        else:
+            self._raw.invalidate(uid)
+        return response
+
+    async def _put(self, uid: str, ical_body: str) -> str:
+        """
+        Store a new calendar object.
+
+        Args:
+            uid: UID of the object, also used as the resource name
+            ical_body: Component block without the VCALENDAR wrapper
+
+        Returns:
+            UID of the stored object
+        """
+        await self._request(
+            "PUT",
+            urljoin(self.calendar_url, f"{uid}.ics"),
+            calendar_document(ical_body),
+            {"Content-Type": "text/calendar; charset=utf-8", "If-None-Match": "*"},
+        )
+        return uid
+
+    @require_connected
+    async def _update_object(self, kind: str, uid: str, data: Dict[str, Any]) -> bool:
+        """
+        Apply field updates to a stored calendar object.
+
+        Backs update_event, update_journal and update_todo.
+
+        Args:
+            kind: Object kind (event, journal or todo)
+            uid: UID of the object
+            data: Dictionary containing updated values
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            response = None
+            cached = self._raw.get(uid)
+            if cached is not None:
+                # Patch the last-seen copy without fetching it; If-Match makes
+                # the server refuse the PUT if the object changed since
+                etag, ical = cached
+                href = self._hrefs.get(uid, f"{uid}.ics")
+                response = await self._put_patched(kind, uid, href, etag, ical, data)
+
+            if response is None or response.status_code == 412:
+                found = await self._locate(COMPONENTS[kind], uid)
+                response = await self._put_patched(
+                    kind,
+                    uid,
+                    found["href"],
+                    found["etag"],
+                    found["calendar_data"],
+                    data,
+                )
+            _raise_for_status(response)
+            self._cache.invalidate(uid)
+
+            logger.info("Updated %s: %s", kind, uid)
+            return True
+        except Exception as e:
+            logger.error("Failed to update %s: %s", kind, e)
+            raise  # Propagate the exception
+
+    @require_connected
+    async def _delete_object(self, kind: str, uid: str) -> bool:
+        """
+        Delete a calendar object by UID.
+
+        Backs delete_event, delete_journal and delete_todo.
+
+        Args:
+            kind: Object kind (event, journal or todo)
+            uid: UID of the object
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            href = self._hrefs.pop(uid, None)
+            if href is None:
+                await self._find_by_uid(COMPONENTS[kind], uid)
+                href = self._hrefs.pop(uid)
+            await self._request("DELETE", urljoin(self.calendar_url, href))
+            self._cache.invalidate(uid)
+            self._raw.invalidate(uid)
+
+            logger.info("Deleted %s: %s", kind, uid)
+            return True
+        except Exception as e:
+            logger.error("Failed to delete %s: %s", kind, e)
+            raise  # Propagate the exception
+
+    @require_connected
+    async def create_event(self, event: Event) -> Optional[str]:
+        """
+        Create a new event on the calendar.
+
+        Args:
+            event: Event object containing event data
+
+        Returns:
+            ID of created event or None if failed
+        """
+        try:
+            if not event.title:
+                event.title = "Untitled Event"
+            event_id = await self._put(event.id, event.to_ical())
+            logger.info("Created event: %s", event.title)
+            return event_id
+        except Exception as e:
+            logger.error("Failed to create event: %s", e)
+            raise  # Propagate the exception
+
+    @require_connected
+    async def read_event(self, event_id: str) -> Optional[Event]:
+        """
+        Read an event from the calendar.
+
+        Args:
+            event_id: ID of the event to read
+
+        Returns:
+            Event object or None if not found
+        """
+        try:
+            cached, calendar_data, etag = await self._fetch_cached("VEVENT", event_id)
+            if cached is not None:
+                logger.info("Read event (not modified): %s", event_id)
+                return cached
+
+            event_obj = _component_to_event(_first_component(calendar_data, "VEVENT"))
+            if etag:
+                self._cache.put(event_id, etag, event_obj)
+            logger.info("Read event: %s", event_id)
+            return event_obj
+        except NotFoundError:
+            logger.info("Event not found: %s", event_id)
+            return None
+        except Exception as e:
+            logger.error("Failed to read event: %s", e)
+            raise
+
+    update_event = functools.partialmethod(_update_object, "event")
+
+    delete_event = functools.partialmethod(_delete_object, "event")
+
+    @require_connected
+    async def create_events(self, events: List[Event]) -> List[Optional[str]]:
+        """
+        Create several events concurrently over the pooled connection.
+
+        Args:
+            events: Event objects to create
+
+        Returns:
+            IDs of the created events, in input order
+        """
+        return await self._gather(self.create_event(e) for e in events)
+
+    @require_connected
+    async def read_events(self, event_ids: List[str]) -> List[Event]:
+        """
+        Read several events with a single calendar-multiget REPORT.
+
+        IDs the multiget does not resolve fall back to concurrent UID queries.
+
+        Args:
+            event_ids: IDs of the events to read
+
+        Returns:
+            List of Event objects for the IDs that were found
+        """
+        try:
+            responses = await self._multiget(event_ids)
+
+            # Objects not stored as <uid>.ics are located by UID, concurrently
+            found = {href_to_id(r["href"]) for r in responses}
+            missing = [i for i in event_ids if i not in found]
+            if missing:
+                results = await self._gather(
+                    (self._find_by_uid("VEVENT", i) for i in missing),
+                    return_exceptions=True,
+                )
+                for result in results:
+                    if isinstance(result, NotFoundError):
+                        continue
+                    if isinstance(result, BaseException):
+                        raise result
+                    responses.append(result)
+
+            event_list = [
+                _component_to_event(_first_component(r["calendar_data"], "VEVENT"))
+                for r in responses
+            ]
+            logger.info("Read %s events", len(event_list))
+            return event_list
+        except Exception as e:
+            logger.error("Failed to read events: %s", e)
+            raise  # Propagate the exception
+
+    @require_connected
+    async def update_events(self, updates: Dict[str, Dict[str, Any]]) -> bool:
+        """
+        Update several events concurrently over the pooled connection.
+
+        Args:
+            updates: Mapping of event ID to updated event data
+
+        Returns:
+            True if every update succeeded
+        """
+        results = await self._gather(
+            self.update_event(i, data) for i, data in updates.items()
+        )
+        return all(results)
+
+    @require_connected
+    async def delete_events(self, event_ids: List[str]) -> bool:
+        """
+        Delete several events concurrently over the pooled connection.
+
+        Args:
+            event_ids: IDs of the events to delete
+
+        Returns:
+            True if every delete succeeded
+        """
+        results = await self._gather(self.delete_event(i) for i in event_ids)
+        return all(results)
+
+    @require_connected
+    async def create_journal(self, journal_data: Dict[str, Any]) -> Optional[str]:
+        """
+        Create a new journal entry on the calendar.
+
+        Args:
+            journal_data: Dictionary containing journal data
+
+        Returns:
+            ID of created journal or None if failed
+        """
+        try:
+            uid = journal_data.get("id") or new_id()
+            journal_id = await self._put(uid, journal_to_ical(uid, journal_data))
+            logger.info("Created journal: %s", journal_data.get("title"))
+            return journal_id
+        except Exception as e:
+            logger.error("Failed to create journal: %s", e)
+            raise  # Propagate the exception
+
+    @require_connected
+    async def read_journal(self, journal_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a journal entry from the calendar.
+
+        Args:
+            journal_id: ID of the journal entry to read
+
+        Returns:
+            Dictionary containing journal data or None if not found
+        """
+        try:
+            cached, calendar_data, etag = await self._fetch_cached(
+                "VJOURNAL", journal_id
+            )
+            if cached is not None:
+                logger.info("Read journal (not modified): %s", journal_id)
+                return cached
+
+            journal_data = _component_to_journal(
+                _first_component(calendar_data, "VJOURNAL")
+            )
+            if etag:
+                self._cache.put(journal_id, etag, journal_data)
+            logger.info("Read journal: %s", journal_id)
+            return journal_data
+        except NotFoundError:
+            logger.info("Journal not found: %s", journal_id)
+            return None
+        except Exception as e:
+            logger.error("Failed to read journal: %s", e)
+            raise  # Propagate the exception
+
+    update_journal = functools.partialmethod(_update_object, "journal")
+
+    delete_journal = functools.partialmethod(_delete_object, "journal")
+
+    @require_connected
+    async def create_todo(self, todo: Todo) -> Optional[str]:
+        """
+        Create a new todo item on the calendar.
+
+        Args:
+            todo: Todo object containing todo data
+
+        Returns:
+            ID of created todo or None if failed
+        """
+        try:
+            if not todo.title:
+                todo.title = "Untitled Todo"
+            todo_id = await self._put(todo.id, todo.to_ical())
+            logger.info("Created todo: %s", todo.title)
+            return todo_id
+        except Exception as e:
+            logger.error("Failed to create todo: %s", e)
+            raise
+
+    @require_connected
+    async def read_todo(self, todo_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a todo item from the calendar.
+
+        Args:
+            todo_id: ID of the todo item to read
+
+        Returns:
+            Dictionary containing todo data or None if not found
+        """
+        try:
+            cached, calendar_data, etag = await self._fetch_cached("VTODO", todo_id)
+            if cached is not None:
+                logger.info("Read todo (not modified): %s", todo_id)
+                return cached
+
+            todo_data = _component_to_todo(
+                _first_component(calendar_data, "VTODO")
+            ).to_dict()
+            if etag:
+                self._cache.put(todo_id, etag, todo_data)
+            logger.info("Read todo: %s", todo_id)
+            return todo_data
+        except NotFoundError:
+            logger.info("Todo not found: %s", todo_id)
+            return None
+        except Exception as e:
+            logger.error("Failed to read todo: %s", e)
+            raise  # Propagate the exception
+
+    update_todo = functools.partialmethod(_update_object, "todo")
+
+    delete_todo = functools.partialmethod(_delete_object, "todo")
+
+    async def _aiter_objects(
+        self,
+        component: str,
+        convert,
+        start: Optional[datetime],
+        end: Optional[datetime],
+    ) -> AsyncIterator[Any]:
+        """
+        Convert objects from a streamed calendar-query one at a time.
+
+        Args:
+            component: Component name (VEVENT, VTODO, VJOURNAL)
+            convert: Converter from the parsed component to the yielded value
+            start: Optional start of the time range
+            end: Optional end of the time range
+
+        Yields:
+            Converted objects, in the order the server sent them
+        """
+        async for response in self._iter_query(component, _time_range(start, end)):
+            yield convert(_first_component(response["calendar_data"], component))
+
+    @require_connected
+    def aiter_events(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> AsyncIterator[Event]:
+        """
+        Stream events from the calendar as the REPORT reply arrives.
+
+        Each item is yielded as soon as its response element has been parsed.
+        When either bound is given the server filters by time range.
+
+        Args:
+            start: Optional start of the time range
+            end: Optional end of the time range
+
+        Returns:
+            Async iterator over Event objects
+        """
+        return self._aiter_objects("VEVENT", _component_to_event, start, end)
+
+    @require_connected
+    async def get_events(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> list:
+        """
+        Retrieve events from the calendar.
+
+        Args:
+            start: Optional start of the time range
+            end: Optional end of the time range
+
+        Returns:
+            List of Event objects
+        """
+        try:
+            event_list = [item async for item in self.aiter_events(start, end)]
+            logger.info("Retrieved %s events", len(event_list))
+            return event_list
+        except Exception as e:
+            logger.error("Failed to retrieve events: %s", e)
+            raise  # Propagate the exception
+
+    @require_connected
+    def aiter_todos(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> AsyncIterator[Todo]:
+        """
+        Stream todos from the calendar as the REPORT reply arrives.
+
+        Each item is yielded as soon as its response element has been parsed.
+        When either bound is given the server filters by time range.
+
+        Args:
+            start: Optional start of the time range
+            end: Optional end of the time range
+
+        Returns:
+            Async iterator over Todo objects
+        """
+        return self._aiter_objects("VTODO", _component_to_todo, start, end)
+
+    @require_connected
+    async def get_todos(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> list:
+        """
+        Retrieve todos from the calendar.
+
+        Args:
+            start: Optional start of the time range
+            end: Optional end of the time range
+
+        Returns:
+            List of Todo objects
+        """
+        try:
+            todo_list = [item async for item in self.aiter_todos(start, end)]
+            logger.info("Retrieved %s todos", len(todo_list))
+            return todo_list
+        except Exception as e:
+            logger.error("Failed to retrieve todos: %s", e)
+            raise  # Propagate the exception
+
+    @require_connected
+    def aiter_journals(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream journals from the calendar as the REPORT reply arrives.
+
+        Each item is yielded as soon as its response element has been parsed.
+        When either bound is given the server filters by time range.
+
+        Args:
+            start: Optional start of the time range
+            end: Optional end of the time range
+
+        Returns:
+            Async iterator over journal dictionaries
+        """
+        return self._aiter_objects("VJOURNAL", _component_to_journal, start, end)
+
+    @require_connected
+    async def get_journals(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> list:
+        """
+        Retrieve journals from the calendar.
+
+        Args:
+            start: Optional start of the time range
+            end: Optional end of the time range
+
+        Returns:
+            List of journal dictionaries
+        """
+        try:
+            journal_list = [item async for item in self.aiter_journals(start, end)]
+            logger.info("Retrieved %s journals", len(journal_list))
+            return journal_list
+        except Exception as e:
+            logger.error("Failed to retrieve journals: %s", e)
+            raise  # Propagate the exception
+
+    @require_connected
+    async def sync(self) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Fetch the objects changed since the previous sync (RFC 6578).
+
+        The first call returns every object in the calendar; later calls
+        return only the delta since the stored sync token.
+
+        Returns:
+            Tuple of (new sync token, list of dicts with href, etag and deleted)
+        """
+        try:
+            response = await self._request(
+                "REPORT",
+                self.calendar_url,
+                _SYNC_BODY.format(token=_escape(self._sync_token)),
+                {"Depth": "0"},
+            )
+            token, changes = _parse_sync_collection(response.content)
+            for change in changes:
+                self._cache.invalidate(href_to_id(change["href"]))
+                self._raw.invalidate(href_to_id(change["href"]))
+            self._sync_token = token
+
+            logger.info("Synced %s changed objects", len(changes))
+            return token, changes
+        except Exception as e:
+            logger.error("Failed to sync calendar: %s", e)
+            raise  # Propagate the exception
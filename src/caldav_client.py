@@ -3,19 +3,378 @@ Calendar Client for MCP Calendar Application
 Handles connection and communication with the calendar.
 """
 
+import base64
+import copy
+import functools
+import inspect
 import logging
-from typing import Dict, Any, Optional
+import operator
+import threading
+from datetime import datetime
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from etag_cache import ETagCache
+from models.base_model import intern_status, new_id
 from models.event import Event
+from models.ical_format import (
+    calendar_document,
+    content_lines,
+    date_line,
+    utc_stamp,
+)
 from models.todo import Todo
 
-import caldav
+# caldav (and with it requests, lxml and icalendar) is imported on first use
+# so that importing this module stays cheap at server start-up
 
 logger = logging.getLogger(__name__)
 
+# Shared DAV clients keyed by (server_url, Authorization header, verify TLS)
+# so every CalDAVClient with the same account and settings reuses one HTTP
+# session and its connection pool. Each entry holds [client, users]; the
+# session is closed once its last user disconnects
+_DAV_CLIENTS: Dict[Tuple[str, str, bool], List[Any]] = {}
+_DAV_CLIENTS_LOCK = threading.Lock()
+
+# Upper bound on requests a batch operation keeps in flight at once, so large
+# batches stay within the HTTP pool and do not trip server-side rate limits
+MAX_CONCURRENCY = 8
+
+# Default for list_kind's ctag argument: probe the collection tag itself
+_PROBE = object()
+
+
+# iCalendar component name for each object kind
+COMPONENTS = {"event": "VEVENT", "journal": "VJOURNAL", "todo": "VTODO"}
+
+# PROPFIND body for the collection tag, which changes whenever any object in
+# the calendar does
+_CTAG_QUERY = (
+    '<?xml version="1.0" encoding="utf-8"?>'
+    '<d:propfind xmlns:d="DAV:" xmlns:cs="http://calendarserver.org/ns/">'
+    "<d:prop><cs:getctag/><d:sync-token/></d:prop>"
+    "</d:propfind>"
+)
+_CTAG_PATH = ".//{http://calendarserver.org/ns/}getctag"
+_SYNC_TOKEN_PATH = ".//{DAV:}sync-token"
+
+# (update key, iCalendar property) pairs accepted by update_* for each kind
+UPDATE_FIELDS = {
+    "event": (
+        ("title", "summary"),
+        ("description", "description"),
+        ("start_time", "dtstart"),
+        ("end_time", "dtend"),
+        ("location", "location"),
+        ("status", "status"),
+    ),
+    "journal": (
+        ("title", "summary"),
+        ("description", "description"),
+        ("date", "dtstart"),
+        ("status", "status"),
+    ),
+    "todo": (
+        ("title", "summary"),
+        ("description", "description"),
+        ("priority", "priority"),
+        ("status", "status"),
+        ("due_date", "due"),
+        ("completed_date", "completed"),
+    ),
+}
+
+# (result key, iCalendar property, converter) triples read by read_journal and
+# read_todo; properties that are missing or empty keep the default value
+_DATE_VALUE = operator.attrgetter("dt")
+READ_FIELDS = {
+    "journal": (
+        ("title", "summary", str),
+        ("description", "description", str),
+        ("date", "dtstart", _DATE_VALUE),
+        ("status", "status", intern_status),
+    ),
+    "todo": (
+        ("title", "summary", str),
+        ("description", "description", str),
+        ("priority", "priority", int),
+        ("status", "status", intern_status),
+        ("due_date", "due", _DATE_VALUE),
+        ("completed_date", "completed", _DATE_VALUE),
+    ),
+}
+
+
+def read_fields(data: Dict[str, Any], component, fields) -> Dict[str, Any]:
+    """
+    Copy converted property values from a component into a dictionary.
+
+    Args:
+        data: Dictionary pre-filled with default values
+        component: icalendar component, or None to keep every default
+        fields: (key, property, converter) triples, e.g. READ_FIELDS["todo"]
+
+    Returns:
+        The updated dictionary
+    """
+    if component is not None:
+        get = component.get
+        for key, prop, convert in fields:
+            value = get(prop)
+            if value:
+                data[key] = convert(value)
+    return data
+
+
+def href_to_id(href: str) -> str:
+    """
+    Derive an object ID from its href, which is stored as <id>.ics.
+
+    Args:
+        href: Object URL or path
+
+    Returns:
+        Object ID
+    """
+    name = href.rstrip("/").rsplit("/", 1)[-1]
+    return name[: -len(".ics")] if name.endswith(".ics") else name
+
+
+def first_component(calendar, name: str):
+    """
+    Return the first component of the given type in a parsed calendar.
+
+    Object components sit directly under VCALENDAR, so only its children are
+    scanned rather than walking every nested VALARM or VTIMEZONE.
+
+    Args:
+        calendar: icalendar Calendar
+        name: Component name (VEVENT, VTODO, VJOURNAL)
+
+    Returns:
+        icalendar component or None
+    """
+    return next((c for c in calendar.subcomponents if c.name == name), None)
+
+
+def patch_ical(ical: str, kind: str, data: Dict[str, Any]) -> str:
+    """
+    Apply update_* field changes to a serialised calendar object.
+
+    Args:
+        ical: iCalendar document holding the object
+        kind: Object kind (event, journal or todo)
+        data: Dictionary containing updated data
+
+    Returns:
+        The updated iCalendar document
+    """
+    import icalendar
+
+    calendar = icalendar.Calendar.from_ical(ical)
+    component = first_component(calendar, COMPONENTS[kind])
+    if component is not None:
+        for key, prop in UPDATE_FIELDS[kind]:
+            if key in data:
+                component[prop] = data[key]
+    return calendar.to_ical().decode()
+
+
+def journal_to_ical(uid: str, journal_data: Dict[str, Any]) -> str:
+    """
+    Build a VJOURNAL block from journal data.
+
+    Args:
+        uid: Journal UID
+        journal_data: Dictionary containing journal data
+
+    Returns:
+        iCalendar string representation
+    """
+    parts = [
+        f"BEGIN:VJOURNAL\r\nUID:{uid}\r\nDTSTAMP:{utc_stamp()}\r\n",
+        content_lines(
+            (
+                ("SUMMARY", journal_data.get("title") or "Untitled Journal"),
+                ("DESCRIPTION", journal_data.get("description", "")),
+            )
+        ),
+    ]
+    date = journal_data.get("date")
+    if date:
+        parts.append(date_line("DTSTART", date))
+    if journal_data.get("status"):
+        parts.append(f"STATUS:{journal_data['status']}\r\n")
+    parts.append("END:VJOURNAL\r\n")
+    return "".join(parts)
+
+
+def _dav_errors():
+    """
+    Return the caldav error module, importing caldav on first use.
+
+    Only evaluated from ``except`` clauses, i.e. once an exception is raised.
+    """
+    from caldav.lib import error
+
+    return error
+
+
+class NotConnectedError(Exception):
+    """Raised when a client method is called before connect()."""
+
+
+def require_connected(fn):
+    """
+    Decorator that rejects calls made before the client is connected.
+
+    Works for both plain and coroutine methods and raises NotConnectedError
+    when the client is not connected. An authorization failure disconnects
+    the client so the next call reconnects.
+
+    Args:
+        fn: Client method requiring an open connection
+
+    Returns:
+        Wrapped method
+    """
+    if inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def async_wrapper(self, *args, **kwargs):
+            if not self.is_connected():
+                raise NotConnectedError("Not connected to the calendar")
+            try:
+                return await fn(self, *args, **kwargs)
+            except _dav_errors().AuthorizationError:
+                await self.disconnect()
+                raise
+
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        if not self.is_connected():
+            raise NotConnectedError("Not connected to the calendar")
+        try:
+            return fn(self, *args, **kwargs)
+        except _dav_errors().AuthorizationError:
+            self.disconnect()
+            raise
+
+    return wrapper
+
+
+def _basic_auth_header(username: str, password: str) -> str:
+    """
+    Encode credentials as an HTTP Basic Authorization header value.
+
+    Args:
+        username: Account username
+        password: Account password
+
+    Returns:
+        Header value
+    """
+    token = base64.b64encode(f"{username}:{password}".encode("utf-8")).decode("ascii")
+    return f"Basic {token}"
+
+
+def _configure_session(dav_client, auth_header: Optional[str] = None) -> None:
+    """
+    Mount a pooling, retrying HTTP adapter on the DAV client's session.
+
+    Args:
+        dav_client: caldav DAVClient instance
+        auth_header: Authorization header sent preemptively on every request
+    """
+    session = getattr(dav_client, "session", None)
+    if session is None:
+        return
+
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD", "OPTIONS", "PROPFIND", "REPORT"]),
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if auth_header:
+        session.headers["Authorization"] = auth_header
+
+
+def _acquire_dav_client(server_url: str, auth_header: str, use_ssl: bool):
+    """
+    Return the shared DAV client for these settings, creating it if needed.
+
+    Every call must be paired with a _release_dav_client() call.
+
+    Args:
+        server_url: Calendar server URL
+        auth_header: Authorization header value for the account
+        use_ssl: Whether TLS certificates are verified
+
+    Returns:
+        caldav DAVClient instance
+    """
+    import caldav
+
+    key = (server_url, auth_header, use_ssl)
+    with _DAV_CLIENTS_LOCK:
+        entry = _DAV_CLIENTS.get(key)
+        if entry is None:
+            # Construct DAVClient directly: get_davclient() would also
+            # consult CALDAV_* environment variables and config files
+            dav_client = caldav.DAVClient(url=server_url, ssl_verify_cert=use_ssl)
+            # Credentials go out as a precomputed Basic header instead of
+            # being negotiated after a 401 challenge
+            _configure_session(dav_client, auth_header)
+            entry = _DAV_CLIENTS[key] = [dav_client, 0]
+        entry[1] += 1
+        return entry[0]
+
+
+def _release_dav_client(dav_client) -> None:
+    """
+    Drop one user of a shared DAV client, closing its session after the last.
+
+    Args:
+        dav_client: caldav DAVClient returned by _acquire_dav_client()
+    """
+    with _DAV_CLIENTS_LOCK:
+        for key, entry in list(_DAV_CLIENTS.items()):
+            if entry[0] is dav_client:
+                entry[1] -= 1
+                if entry[1] > 0:
+                    return
+                del _DAV_CLIENTS[key]
+                break
+    session = getattr(dav_client, "session", None)
+    if session is not None:
+        session.close()
+
 
 class CalDAVClient:
     """Client for connecting to and interacting with a calendar."""
 
+    __slots__ = (
+        "config_manager",
+        "_client",
+        "_principal",
+        "_calendar",
+        "_cache",
+        "_sync_tokens",
+        "_cfg",
+        "_hrefs",
+        "_raw",
+        "_listings",
+        "_listings_lock",
+    )
+
     def __init__(self, config_manager):
         """
         Initialize the CalDAV client.
@@ -24,8 +383,36 @@ class CalDAVClient:
             config_manager: Configuration manager instance
         """
         self.config_manager = config_manager
-        self.client = None
-        self.connected = False
+        self._client = None
+        self._principal = None
+        self._calendar = None
+        # Reads within read_cache_ttl seconds of the last fetch skip the
+        # conditional GET entirely
+        self._cache = ETagCache(ttl=config_manager.get("read_cache_ttl", 0.0))
+        self._sync_tokens: Dict[str, str] = {}
+        # Connection settings are fixed for the client's lifetime; resolve
+        # them once so reconnects skip the config lookups
+        self._cfg: Tuple[str, str, str, bool, Optional[str]] = (
+            config_manager.get("server_url"),
+            config_manager.get("username"),
+            config_manager.get("password"),
+            config_manager.get("use_ssl", True),
+            config_manager.get("calendar_url"),
+        )
+        self._hrefs: Dict[str, str] = {}
+        # Last-seen (etag, iCalendar text) per object, for If-Match updates
+        self._raw = ETagCache()
+        # Converted unfiltered listings per kind, with the collection CTag
+        # they match; worker threads share them, so access is locked
+        self._listings: Dict[str, Tuple[Optional[str], list]] = {}
+        self._listings_lock = threading.Lock()
+
+    def __enter__(self) -> "CalDAVClient":
+        self.connect()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.disconnect()
 
     def connect(self) -> bool:
         """
@@ -35,42 +422,71 @@ class CalDAVClient:
             True if connection successful, False otherwise
         """
         try:
-            server_url = self.config_manager.get("server_url")
-            username = self.config_manager.get("username")
-            password = self.config_manager.get("password")
-            use_ssl = self.config_manager.get("use_ssl", True)
-
-            # Create connection
-            if use_ssl:
-                self.client = caldav.davclient.get_davclient(
-                    url=server_url,
-                    username=username,
-                    password=password,
-                    ssl_verify_cert=True,
-                )
-            else:
-                self.client = caldav.davclient.get_davclient(
-                    url=server_url,
-                    username=username,
-                    password=password,
-                    ssl_verify_cert=False,
+            server_url, username, password, use_ssl, _ = self._cfg
+
+            # Reuse the shared client for this account when one exists; a
+            # repeated connect keeps the client it already holds
+            if self._client is None:
+                self._client = _acquire_dav_client(
+                    server_url, _basic_auth_header(username, password), bool(use_ssl)
                 )
 
-            self.connected = True
+            self._resolve_calendar()
+
             logger.info("Successfully connected to the calendar")
             return True
 
         except Exception as e:
-            logger.error(f"Failed to connect to the calendar: {e}")
-            self.connected = False
+            logger.error("Failed to connect to the calendar: %s", e)
+            if self._client is not None:
+                _release_dav_client(self._client)
+            self._client = None
+            self._principal = None
+            self._calendar = None
             raise  # Propagate the exception
 
+    def _resolve_calendar(self) -> None:
+        """Bind the configured calendar, or discover the principal's first one."""
+        calendar_url = self._cfg[4]
+        if calendar_url:
+            # A configured calendar needs no principal discovery
+            self._calendar = self._client.calendar(url=calendar_url)
+        else:
+            # Discover the principal and default calendar once per connection
+            self._principal = self._client.principal()
+            self._calendar = self._principal.calendars()[0]  # Use first calendar
+
+    @require_connected
+    def refresh_calendars(self) -> None:
+        """
+        Re-resolve the default calendar, e.g. after calendars were added or
+        removed on the server. Cached objects, hrefs and sync tokens are
+        dropped since they may belong to the previous calendar.
+        """
+        self._resolve_calendar()
+        self._cache.clear()
+        self._sync_tokens.clear()
+        self._hrefs.clear()
+        self._raw.clear()
+        with self._listings_lock:
+            self._listings.clear()
+        logger.info("Refreshed calendars")
+
     def disconnect(self) -> None:
         """Close the connection to the calendar."""
-        if self.client:
-            # In a real implementation, we would close the connection
-            self.client = None
-        self.connected = False
+        if self._client:
+            # Release the shared client; its pooled connections are closed
+            # once no other instance is using it
+            _release_dav_client(self._client)
+            self._client = None
+        self._principal = None
+        self._calendar = None
+        self._cache.clear()
+        self._sync_tokens.clear()
+        self._hrefs.clear()
+        self._raw.clear()
+        with self._listings_lock:
+            self._listings.clear()
         logger.info("Disconnected from the calendar")
 
     def is_connected(self) -> bool:
@@ -80,565 +496,686 @@ class CalDAVClient:
         Returns:
             True if connected, False otherwise
         """
-        return self.connected
+        return self._client is not None
 
-    def create_event(self, event: Event) -> Optional[str]:
+    def is_alive(self) -> bool:
         """
-        Create a new event in the CalDAV server.
+        Probe the server with a short OPTIONS request over the pooled session.
+
+        Returns:
+            True if connected and the server answered successfully
+        """
+        session = getattr(self._client, "session", None)
+        if session is None:
+            return False
+        try:
+            timeout = self.config_manager.get("probe_timeout", 5.0)
+            return session.options(str(self._client.url), timeout=timeout).ok
+        except Exception as e:
+            logger.debug("Liveness probe failed: %s", e)
+            return False
+
+    def _fetch_cached(self, calendar, obj_id: str, lookup):
+        """
+        Fetch a calendar object, revalidating any cached copy by ETag.
 
         Args:
-            event: Event object containing event data
+            calendar: caldav Calendar holding the object
+            obj_id: ID of the object
+            lookup: Fallback used when the object is not stored as <id>.ics
 
         Returns:
-            ID of created event or None if failed
+            Tuple of (cached value, caldav object, etag); the cached value is
+            set only when the server answered 304 Not Modified
+        """
+        import caldav
+
+        url = self._hrefs.get(obj_id) or calendar.url.join(f"{obj_id}.ics")
+        cached = self._cache.get(obj_id)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        response = self._client.request(str(url), "GET", "", headers)
+
+        if response.status == 304 and cached:
+            return cached[1], None, None
+        if response.status == 200:
+            obj = caldav.CalendarObjectResource(
+                client=self._client,
+                url=url,
+                data=response.raw,
+                parent=calendar,
+                id=obj_id,
+            )
+            self._hrefs[obj_id] = str(url)
+            etag = response.headers.get("ETag")
+            if etag:
+                self._raw.put(obj_id, etag, response.raw)
+            return None, obj, etag
+
+        # Not stored under its ID; fall back to a UID search
+        obj = lookup(obj_id)
+        self._hrefs[obj_id] = str(obj.url)
+        return None, obj, None
+
+    def _locate(self, kind: str, obj_id: str):
         """
-        if not self.connected:
-            logger.error("Not connected to the calendar")
-            raise Exception("Not connected to the calendar")
+        Resolve a calendar object, skipping the UID search when its href is known.
 
-        try:
-            # Get the principal and calendar
-            principal = self.client.principal()
-            calendar = principal.calendars()[0]  # Use first calendar
-
-            # Create event using calendar.save_event with parameters
-            new_event = calendar.save_event(
-                summary=event.title or "Untitled Event",
-                description=event.description or "",
-                dtstart=event.start_time,
-                dtend=event.end_time,
-                location=event.location,
-                attendees=event.attendees,
-                status=event.status,
-                rrule=event.rrule if hasattr(event, "rrule") else None,
+        Args:
+            kind: Object kind (event, journal or todo)
+            obj_id: ID of the object
+
+        Returns:
+            caldav object, not yet loaded when built from a remembered href
+        """
+        import caldav
+
+        calendar = self._calendar
+        href = self._hrefs.get(obj_id)
+        if href is not None:
+            return caldav.CalendarObjectResource(
+                client=self._client, url=href, parent=calendar, id=obj_id
             )
 
-            # Return the event ID
-            logger.info(f"Created event: {event.title or 'Untitled Event'}")
-            return new_event.id
-        except Exception as e:
-            logger.error(f"Failed to create event: {e}")
-            raise  # Propagate the exception
+        obj = getattr(calendar, kind)(obj_id)
+        self._hrefs[obj_id] = str(obj.url)
+        return obj
 
-    def read_event(self, event_id: str) -> Optional[Event]:
+    def _convert_caldav_event(self, caldav_event) -> Event:
         """
-        Read an event from the CalDAV server.
+        Convert a CalDAV event to an Event object.
 
         Args:
-            event_id: ID of the event to read
+            caldav_event: CalDAV event object
 
         Returns:
-            Event object or None if not found
+            Event object
         """
-        if not self.connected:
-            logger.error("Not connected to the calendar")
-            raise Exception("Not connected to the calendar")
+        component = first_component(caldav_event.icalendar_instance, "VEVENT")
+        # Fall back to the UID when the object carries no ID
+        uid = caldav_event.id
+        if not uid and component is not None:
+            uid = str(component.get("uid", ""))
+        # Fill the Event directly rather than staging fields in a dict
+        event_obj = Event(id=uid, status="")
+
+        if component is not None:
+            get = component.get
+            event_obj.title = str(get("summary", ""))
+            event_obj.description = str(get("description", ""))
+
+            # Handle date/time values
+            dtstart = get("dtstart")
+            if dtstart:
+                event_obj.start_time = dtstart.dt
+
+            dtend = get("dtend")
+            if dtend:
+                event_obj.end_time = dtend.dt
+
+            event_obj.location = str(get("location", ""))
+            event_obj.status = intern_status(get("status", ""))
+
+            # Handle attendees
+            attendees = get("attendee", [])
+            if attendees:
+                if isinstance(attendees, list):
+                    event_obj.attendees = [str(a) for a in attendees]
+                else:
+                    event_obj.attendees = [str(attendees)]
+
+            # Handle recurrence rule
+            rrule = get("rrule")
+            if rrule:
+                event_obj.rrule = rrule
 
-        try:
-            principal = self.client.principal()
-            calendar = principal.calendars()[0]
-            caldav_event = calendar.event(event_id)
-            event_obj = self._convert_caldav_event(caldav_event)
-            logger.info(f"Read event: {event_id}")
-            return event_obj
-        except Exception as e:
-            logger.error(f"Failed to read event: {e}")
-            raise
+        return event_obj
 
-    def update_event(self, event_id: str, event_data: Dict[str, Any]) -> bool:
+    def _convert_caldav_todo(self, caldav_todo) -> Todo:
         """
-        Update an existing event in the CalDAV server.
+        Convert a CalDAV todo to a Todo object.
 
         Args:
-            event_id: ID of the event to update
-            event_data: Dictionary containing updated event data
+            caldav_todo: CalDAV todo object
 
         Returns:
-            True if successful, False otherwise
+            Todo object
+        """
+        component = first_component(caldav_todo.icalendar_instance, "VTODO")
+        # Fall back to the UID when the object carries no ID
+        uid = caldav_todo.id
+        if not uid and component is not None:
+            uid = str(component.get("uid", ""))
+        # Fill the Todo directly rather than staging fields in a dict
+        todo_obj = Todo(id=uid, status="")
+
+        if component is not None:
+            get = component.get
+            todo_obj.title = str(get("summary", ""))
+            todo_obj.description = str(get("description", ""))
+
+            # Handle priority
+            priority = get("priority")
+            if priority:
+                todo_obj.priority = int(priority)
+
+            todo_obj.status = intern_status(get("status", ""))
+
+            # Handle date/time values
+            due = get("due")
+            if due:
+                todo_obj.due_date = due.dt
+
+            completed = get("completed")
+            if completed:
+                todo_obj.completion_date = completed.dt
+
+        return todo_obj
+
+    def _convert_caldav_journal(self, caldav_journal) -> Dict[str, Any]:
         """
-        if not self.connected:
-            logger.error("Not connected to the calendar")
-            raise Exception("Not connected to the calendar")
+        Convert a CalDAV journal to a dictionary.
 
-        try:
-            # Get the principal and calendar
-            principal = self.client.principal()
-            calendar = principal.calendars()[0]  # Use first calendar
-
-            # Retrieve the event by ID
-            event = calendar.event(event_id)
-
-            # Update the event properties by modifying the icalendar instance
-            for component in event.icalendar_instance.walk():
-                if component.name == "VEVENT":
-                    if "title" in event_data:
-                        component["summary"] = event_data["title"]
-                    if "description" in event_data:
-                        component["description"] = event_data["description"]
-                    if "start_time" in event_data:
-                        component["dtstart"] = event_data["start_time"]
-                    if "end_time" in event_data:
-                        component["dtend"] = event_data["end_time"]
-                    if "location" in event_data:
-                        component["location"] = event_data["location"]
-                    if "status" in event_data:
-                        component["status"] = event_data["status"]
-                    break  # We only need to modify the first VEVENT
-
-            # Save the updated event
-            event.save()
-
-            logger.info(f"Updated event: {event_id}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to update event: {e}")
-            raise  # Propagate the exception
+        Args:
+            caldav_journal: CalDAV journal object
+
+        Returns:
+            Dictionary containing journal data; the date is a datetime
+            (or None), not a formatted string
+        """
+        journal_data = {
+            "id": caldav_journal.id,
+            "title": "",
+            "description": "",
+            "date": None,
+            "status": "",
+        }
+        component = first_component(caldav_journal.icalendar_instance, "VJOURNAL")
+        return read_fields(journal_data, component, READ_FIELDS["journal"])
 
-    def delete_event(self, event_id: str) -> bool:
+    def _convert_caldav_todo_dict(self, caldav_todo) -> Dict[str, Any]:
         """
-        Delete an event from the CalDAV server.
+        Convert a CalDAV todo to a dictionary.
 
         Args:
-            event_id: ID of the event to delete
+            caldav_todo: CalDAV todo object
 
         Returns:
-            True if successful, False otherwise
+            Dictionary containing todo data; due and completed dates are
+            datetimes (or None), not formatted strings
         """
-        if not self.connected:
-            logger.error("Not connected to the calendar")
-            raise Exception("Not connected to the calendar")
+        todo_data = {
+            "id": caldav_todo.id,
+            "title": "",
+            "description": "",
+            "priority": 5,
+            "status": "",
+            "due_date": None,
+            "completed_date": None,
+        }
+        component = first_component(caldav_todo.icalendar_instance, "VTODO")
+        return read_fields(todo_data, component, READ_FIELDS["todo"])
 
-        try:
-            # Get the principal and calendar
-            principal = self.client.principal()
-            calendar = principal.calendars()[0]  # Use first calendar
+    def _put_cached(self, kind: str, obj_id: str, data: Dict[str, Any]) -> bool:
+        """
+        Update an object from its last-seen copy without fetching it first.
 
-            # Retrieve the event by ID
-            event = calendar.event(event_id)
+        The PUT carries If-Match, so the server refuses it if the object
+        changed since that copy was read.
 
-            # Delete the event
-            event.delete()
+        Args:
+            kind: Object kind (event, journal or todo)
+            obj_id: ID of the object to update
+            data: Dictionary containing updated data
 
-            logger.info(f"Deleted event: {event_id}")
+        Returns:
+            True if the update was stored, False if the caller has to fetch
+            the object and retry
+        """
+        cached = self._raw.get(obj_id)
+        if cached is None:
+            return False
+
+        etag, ical = cached
+        url = self._hrefs.get(obj_id) or str(self._calendar.url.join(f"{obj_id}.ics"))
+        body = patch_ical(ical, kind, data)
+        response = self._client.request(
+            url,
+            "PUT",
+            body,
+            {"Content-Type": "text/calendar; charset=utf-8", "If-Match": etag},
+        )
+        if response.status == 412:
+            # Changed on the server since it was read
+            self._raw.invalidate(obj_id)
+            return False
+        if response.status >= 400:
+            raise _dav_errors().PutError(f"PUT {url} returned {response.status}")
+
+        new_etag = response.headers.get("ETag")
+        if new_etag:
+            self._raw.put(obj_id, new_etag, body)
+        else:
+            self._raw.invalidate(obj_id)
+        return True
+
+    @require_connected
+    def _update_object(self, kind: str, obj_id: str, data: Dict[str, Any]) -> bool:
+        """
+        Update an existing calendar object in the CalDAV server.
+
+        Backs update_event, update_journal and update_todo.
+
+        Args:
+            kind: Object kind (event, journal or todo)
+            obj_id: ID of the object to update
+            data: Dictionary containing updated data
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            if not self._put_cached(kind, obj_id, data):
+                # Retrieve the object by ID
+                obj = self._locate(kind, obj_id)
+                if obj.data is None:
+                    obj.load()
+
+                # Update the properties by modifying the icalendar instance
+                component_name = COMPONENTS[kind]
+                component = first_component(obj.icalendar_instance, component_name)
+                if component is not None:
+                    for key, prop in UPDATE_FIELDS[kind]:
+                        if key in data:
+                            component[prop] = data[key]
+
+                # Save the updated object
+                obj.save()
+                self._raw.invalidate(obj_id)
+            self._cache.invalidate(obj_id)
+
+            logger.info("Updated %s: %s", kind, obj_id)
             return True
         except Exception as e:
-            logger.error(f"Failed to delete event: {e}")
+            logger.error("Failed to update %s: %s", kind, e)
             raise  # Propagate the exception
 
-    def create_journal(self, journal_data: Dict[str, Any]) -> Optional[str]:
+    @require_connected
+    def _delete_object(self, kind: str, obj_id: str) -> bool:
         """
-        Create a new journal entry in the CalDAV server.
+        Delete a calendar object from the CalDAV server.
+
+        Backs delete_event, delete_journal and delete_todo.
 
         Args:
-            journal_data: Dictionary containing journal data
+            kind: Object kind (event, journal or todo)
+            obj_id: ID of the object to delete
 
         Returns:
-            ID of created journal or None if failed
+            True if successful, False otherwise
         """
-        if not self.connected:
-            logger.error("Not connected to the calendar")
-            raise Exception("Not connected to the calendar")
-
         try:
-            # Get the principal and calendar
-            principal = self.client.principal()
-            calendar = principal.calendars()[0]  # Use first calendar
-
-            # Create journal entry using calendar.save_journal with parameters
-            new_journal = calendar.save_journal(
-                summary=journal_data.get("title", "Untitled Journal"),
-                description=journal_data.get("description", ""),
-                dtstart=journal_data.get("date"),
-                status=journal_data.get("status"),
-            )
+            # Retrieve the object by ID and delete it
+            self._locate(kind, obj_id).delete()
+            self._cache.invalidate(obj_id)
+            self._raw.invalidate(obj_id)
+            self._hrefs.pop(obj_id, None)
 
-            # Return the journal ID
-            logger.info(f"Created journal: {journal_data.get('title', 'Unknown')}")
-            return new_journal.id
+            logger.info("Deleted %s: %s", kind, obj_id)
+            return True
         except Exception as e:
-            logger.error(f"Failed to create journal: {e}")
+            logger.error("Failed to delete %s: %s", kind, e)
             raise  # Propagate the exception
 
-    def read_journal(self, journal_id: str) -> Optional[Dict[str, Any]]:
+    @require_connected
+    def _create_object(self, kind: str, ical: str, title: str) -> Optional[str]:
         """
-        Read a journal entry from the CalDAV server.
+        Store a serialised calendar object in the CalDAV server.
+
+        Backs create_event, create_journal and create_todo.
 
         Args:
-            journal_id: ID of the journal entry to read
+            kind: Object kind (event, journal or todo)
+            ical: Component block without the VCALENDAR wrapper
+            title: Title used for logging
 
         Returns:
-            Dictionary containing journal data or None if not found
+            ID of created object or None if failed
         """
-        if not self.connected:
-            logger.error("Not connected to the calendar")
-            raise Exception("Not connected to the calendar")
-
         try:
-            # Get the principal and calendar
-            principal = self.client.principal()
-            calendar = principal.calendars()[0]  # Use first calendar
-
-            # Retrieve the journal by ID
-            journal = calendar.journal(journal_id)
-
-            # Convert to dictionary format
-            journal_data = {
-                "id": journal_id,
-                "title": "",
-                "description": "",
-                "date": "",
-                "status": "",
-            }
-
-            # Walk through components to find VJOURNAL
-            for component in journal.icalendar_instance.walk():
-                if component.name == "VJOURNAL":
-                    journal_data["title"] = str(component.get("summary", ""))
-                    journal_data["description"] = str(component.get("description", ""))
-
-                    # Handle date/time values
-                    dtstart = component.get("dtstart")
-                    if dtstart:
-                        journal_data["date"] = dtstart.dt.strftime("%m/%d/%Y %H:%M")
-
-                    journal_data["status"] = str(component.get("status", ""))
-                    break  # We only need the first VJOURNAL
-
-            logger.info(f"Read journal: {journal_id}")
-            return journal_data
+            # Save the serialised object directly rather than having caldav
+            # assemble the component from keyword arguments
+            save = getattr(self._calendar, f"save_{kind}")
+            new_obj = save(calendar_document(ical))
+            self._hrefs[new_obj.id] = str(new_obj.url)
+
+            logger.info("Created %s: %s", kind, title)
+            return new_obj.id
         except Exception as e:
-            logger.error(f"Failed to read journal: {e}")
+            logger.error("Failed to create %s: %s", kind, e)
             raise  # Propagate the exception
 
-    def update_journal(self, journal_id: str, journal_data: Dict[str, Any]) -> bool:
+    @require_connected
+    def _read_object(self, kind: str, convert, obj_id: str) -> Any:
         """
-        Update an existing journal entry in the CalDAV server.
+        Read a calendar object from the CalDAV server.
+
+        Backs read_event, read_journal and read_todo.
 
         Args:
-            journal_id: ID of the journal entry to update
-            journal_data: Dictionary containing updated journal data
+            kind: Object kind (event, journal or todo)
+            convert: Converter from the caldav object to the returned value
+            obj_id: ID of the object to read
 
         Returns:
-            True if successful, False otherwise
+            Converted object or None if not found
         """
-        if not self.connected:
-            logger.error("Not connected to the calendar")
-            raise Exception("Not connected to the calendar")
-
         try:
-            # Get the principal and calendar
-            principal = self.client.principal()
-            calendar = principal.calendars()[0]  # Use first calendar
-
-            # Retrieve the journal by ID
-            journal = calendar.journal(journal_id)
-
-            # Update the journal properties by modifying the icalendar instance
-            for component in journal.icalendar_instance.walk():
-                if component.name == "VJOURNAL":
-                    if "title" in journal_data:
-                        component["summary"] = journal_data["title"]
-                    if "description" in journal_data:
-                        component["description"] = journal_data["description"]
-                    if "date" in journal_data:
-                        component["dtstart"] = journal_data["date"]
-                    if "status" in journal_data:
-                        component["status"] = journal_data["status"]
-                    break  # We only need to modify the first VJOURNAL
-
-            # Save the updated journal
-            journal.save()
-
-            logger.info(f"Updated journal: {journal_id}")
-            return True
+            fresh = self._cache.get_fresh(obj_id)
+            if fresh is not None:
+                logger.info("Read %s (cached): %s", kind, obj_id)
+                return fresh
+
+            calendar = self._calendar
+
+            # Retrieve the object by ID, reusing the cached copy if unchanged
+            cached, obj, etag = self._fetch_cached(
+                calendar, obj_id, getattr(calendar, kind)
+            )
+            if cached is not None:
+                self._cache.touch(obj_id)
+                logger.info("Read %s (not modified): %s", kind, obj_id)
+                return cached
+
+            value = convert(self, obj)
+            if etag:
+                self._cache.put(obj_id, etag, value)
+            logger.info("Read %s: %s", kind, obj_id)
+            return value
+        except _dav_errors().NotFoundError:
+            logger.info("%s not found: %s", kind.capitalize(), obj_id)
+            return None
         except Exception as e:
-            logger.error(f"Failed to update journal: {e}")
+            logger.error("Failed to read %s: %s", kind, e)
             raise  # Propagate the exception
 
-    def delete_journal(self, journal_id: str) -> bool:
+    def create_event(self, event: Event) -> Optional[str]:
         """
-        Delete a journal entry from the CalDAV server.
+        Create a new event in the CalDAV server.
 
         Args:
-            journal_id: ID of the journal entry to delete
+            event: Event object containing event data
 
         Returns:
-            True if successful, False otherwise
+            ID of created event or None if failed
         """
-        if not self.connected:
-            logger.error("Not connected to the calendar")
-            raise Exception("Not connected to the calendar")
+        if not event.title:
+            event.title = "Untitled Event"
+        return self._create_object("event", event.to_ical(), event.title)
 
-        try:
-            # Get the principal and calendar
-            principal = self.client.principal()
-            calendar = principal.calendars()[0]  # Use first calendar
+    read_event = functools.partialmethod(_read_object, "event", _convert_caldav_event)
 
-            # Retrieve the journal by ID
-            journal = calendar.journal(journal_id)
+    update_event = functools.partialmethod(_update_object, "event")
 
-            # Delete the journal
-            journal.delete()
+    delete_event = functools.partialmethod(_delete_object, "event")
 
-            logger.info(f"Deleted journal: {journal_id}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to delete journal: {e}")
-            raise  # Propagate the exception
+    @require_connected
+    def create_events(self, events: List[Event]) -> List[Optional[str]]:
+        """
+        Create several events back to back on the pooled session.
 
-    def create_todo(self, todo: Todo) -> Optional[str]:
-        """Create a new todo item in the CalDAV server using a Todo object.
-    
         Args:
-            todo: A :class:`~models.todo.Todo` instance containing the todo data.
-    
+            events: Event objects to create
+
+        Returns:
+            IDs of the created events, in input order
+        """
+        return [self.create_event(event) for event in events]
+
+    @require_connected
+    def read_events(self, event_ids: List[str]) -> List[Event]:
+        """
+        Read several events with a single calendar-multiget REPORT.
+
+        IDs the multiget does not resolve fall back to a UID query each.
+
+        Args:
+            event_ids: IDs of the events to read
+
         Returns:
-            The ID of the created todo or ``None`` if creation failed.
+            List of Event objects for the IDs that were found
         """
-        if not self.connected:
-            logger.error("Not connected to the calendar")
-            raise Exception("Not connected to the calendar")
-    
         try:
-            # Get the principal and calendar
-            principal = self.client.principal()
-            calendar = principal.calendars()[0]  # Use first calendar
-    
-            # Create todo using calendar.save_todo with parameters from the Todo object
-            new_todo = calendar.save_todo(
-                summary=todo.title or "Untitled Todo",
-                description=getattr(todo, "description", ""),
-                priority=getattr(todo, "priority", 5),
-                status=getattr(todo, "status", None),
-                due=todo.due_date,
-                completed=getattr(todo, "completion_date", None),
-            )
-    
-            logger.info(f"Created todo: {todo.title or 'Unknown'}")
-            return new_todo.id
+            calendar = self._calendar
+
+            # Objects are stored as <uid>.ics, so the hrefs can be derived
+            urls = [calendar.url.join(f"{event_id}.ics") for event_id in event_ids]
+            event_list = [
+                self._convert_caldav_event(event)
+                for event in calendar.calendar_multiget(urls)
+            ]
+
+            # Objects not stored as <uid>.ics are located by UID instead
+            found = {event.id for event in event_list}
+            for event_id in event_ids:
+                if event_id in found:
+                    continue
+                try:
+                    event_list.append(
+                        self._convert_caldav_event(calendar.event(event_id))
+                    )
+                except _dav_errors().NotFoundError:
+                    continue
+            logger.info("Read %s events", len(event_list))
+            return event_list
         except Exception as e:
-            logger.error(f"Failed to create todo: {e}")
+            logger.error("Failed to read events: %s", e)
             raise
 
-    def read_todo(self, todo_id: str) -> Optional[Dict[str, Any]]:
+    @require_connected
+    def update_events(self, updates: Dict[str, Dict[str, Any]]) -> bool:
         """
-        Read a todo item from the CalDAV server.
+        Update several events back to back on the pooled session.
 
         Args:
-            todo_id: ID of the todo item to read
+            updates: Mapping of event ID to updated event data
 
         Returns:
-            Dictionary containing todo data or None if not found
+            True if every update succeeded
         """
-        if not self.connected:
-            logger.error("Not connected to the calendar")
-            raise Exception("Not connected to the calendar")
+        return all(
+            [self.update_event(event_id, data) for event_id, data in updates.items()]
+        )
 
-        try:
-            # Get the principal and calendar
-            principal = self.client.principal()
-            calendar = principal.calendars()[0]  # Use first calendar
-
-            # Retrieve the todo by ID
-            todo = calendar.todo(todo_id)
-
-            # Convert to dictionary format
-            todo_data = {
-                "id": todo_id,
-                "title": "",
-                "description": "",
-                "priority": 5,
-                "status": "",
-                "due_date": "",
-                "completed_date": "",
-            }
-
-            # Walk through components to find VTODO
-            for component in todo.icalendar_instance.walk():
-                if component.name == "VTODO":
-                    todo_data["title"] = str(component.get("summary", ""))
-                    todo_data["description"] = str(component.get("description", ""))
-
-                    # Handle priority
-                    priority = component.get("priority")
-                    if priority:
-                        todo_data["priority"] = int(priority)
-
-                    todo_data["status"] = str(component.get("status", ""))
-
-                    # Handle date/time values
-                    due = component.get("due")
-                    if due:
-                        todo_data["due_date"] = due.dt.strftime("%m/%d/%Y %H:%M")
-
-                    completed = component.get("completed")
-                    if completed:
-                        todo_data["completed_date"] = completed.dt.strftime(
-                            "%m/%d/%Y %H:%M"
-                        )
-                    break  # We only need the first VTODO
-
-            logger.info(f"Read todo: {todo_id}")
-            return todo_data
-        except Exception as e:
-            logger.error(f"Failed to read todo: {e}")
-            raise  # Propagate the exception
+    @require_connected
+    def delete_events(self, event_ids: List[str]) -> bool:
+        """
+        Delete several events back to back on the pooled session.
 
-    def update_todo(self, todo_id: str, todo_data: Dict[str, Any]) -> bool:
+        Args:
+            event_ids: IDs of the events to delete
+
+        Returns:
+            True if every delete succeeded
+        """
+        return all([self.delete_event(event_id) for event_id in event_ids])
+
+    def create_journal(self, journal_data: Dict[str, Any]) -> Optional[str]:
         """
-        Update an existing todo item in the CalDAV server.
+        Create a new journal entry in the CalDAV server.
 
         Args:
-            todo_id: ID of the todo item to update
-            todo_data: Dictionary containing updated todo data
+            journal_data: Dictionary containing journal data
 
         Returns:
-            True if successful, False otherwise
+            ID of created journal or None if failed
         """
-        if not self.connected:
-            logger.error("Not connected to the calendar")
-            raise Exception("Not connected to the calendar")
+        return self._create_object(
+            "journal",
+            journal_to_ical(new_id(), journal_data),
+            journal_data.get("title") or "Untitled Journal",
+        )
 
-        try:
-            # Get the principal and calendar
-            principal = self.client.principal()
-            calendar = principal.calendars()[0]  # Use first calendar
-
-            # Retrieve the todo by ID
-            todo = calendar.todo(todo_id)
-
-            # Update the todo properties by modifying the icalendar instance
-            for component in todo.icalendar_instance.walk():
-                if component.name == "VTODO":
-                    if "title" in todo_data:
-                        component["summary"] = todo_data["title"]
-                    if "description" in todo_data:
-                        component["description"] = todo_data["description"]
-                    if "priority" in todo_data:
-                        component["priority"] = todo_data["priority"]
-                    if "status" in todo_data:
-                        component["status"] = todo_data["status"]
-                    if "due_date" in todo_data:
-                        component["due"] = todo_data["due_date"]
-                    if "completed_date" in todo_data:
-                        component["completed"] = todo_data["completed_date"]
-                    break  # We only need to modify the first VTODO
-
-            # Save the updated todo
-            todo.save()
-
-            logger.info(f"Updated todo: {todo_id}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to update todo: {e}")
-            raise  # Propagate the exception
+    read_journal = functools.partialmethod(
+        _read_object, "journal", _convert_caldav_journal
+    )
 
-    def delete_todo(self, todo_id: str) -> bool:
+    update_journal = functools.partialmethod(_update_object, "journal")
+
+    delete_journal = functools.partialmethod(_delete_object, "journal")
+
+    def create_todo(self, todo: Todo) -> Optional[str]:
         """
-        Delete a todo item from the CalDAV server.
+        Create a new todo item in the CalDAV server.
 
         Args:
-            todo_id: ID of the todo item to delete
+            todo: Todo object containing todo data
 
         Returns:
-            True if successful, False otherwise
+            ID of created todo or None if failed
         """
-        if not self.connected:
-            logger.error("Not connected to the calendar")
-            raise Exception("Not connected to the calendar")
+        if not todo.title:
+            todo.title = "Untitled Todo"
+        return self._create_object("todo", todo.to_ical(), todo.title)
 
-        try:
-            # Get the principal and calendar
-            principal = self.client.principal()
-            calendar = principal.calendars()[0]  # Use first calendar
+    read_todo = functools.partialmethod(_read_object, "todo", _convert_caldav_todo_dict)
 
-            # Retrieve the todo by ID
-            todo = calendar.todo(todo_id)
+    update_todo = functools.partialmethod(_update_object, "todo")
 
-            # Delete the todo
-            todo.delete()
+    delete_todo = functools.partialmethod(_delete_object, "todo")
 
-            logger.info(f"Deleted todo: {todo_id}")
-            return True
+    def _collection_tag(self, calendar) -> Optional[str]:
+        """
+        Fetch the calendar's CTag, or its sync token when it has no CTag.
+
+        Args:
+            calendar: caldav Calendar
+
+        Returns:
+            Tag string, or None if the server reports neither property
+        """
+        try:
+            tree = self._client.propfind(str(calendar.url), _CTAG_QUERY, depth=0).tree
         except Exception as e:
-            logger.error(f"Failed to delete todo: {e}")
-            raise  # Propagate the exception
+            logger.debug("Could not fetch collection tag: %s", e)
+            return None
+        if tree is None:
+            return None
+        return tree.findtext(_CTAG_PATH) or tree.findtext(_SYNC_TOKEN_PATH) or None
+
+    def _list_objects(
+        self, kind: str, start_date: Optional[str], end_date: Optional[str]
+    ) -> list:
+        """
+        Fetch the objects of one kind, filtered by time range on the server.
 
-    def _convert_caldav_event(self, caldav_event) -> Event:
+        Args:
+            kind: Object kind (event, journal or todo)
+            start_date: Optional start date filter (ISO format)
+            end_date: Optional end date filter (ISO format)
+
+        Returns:
+            List of caldav objects with their data loaded
         """
-        Convert a CalDAV event to an Event object.
+        calendar = self._calendar
+        if not (start_date or end_date):
+            return getattr(calendar, f"{kind}s")()
+
+        # Let the server apply the time-range filter in its REPORT; a missing
+        # bound leaves that side of the range open
+        return calendar.search(
+            start=datetime.fromisoformat(start_date) if start_date else None,
+            end=datetime.fromisoformat(end_date) if end_date else None,
+            **{kind: True},
+        )
+
+    @require_connected
+    def listing_tag(self, *kinds: str) -> Optional[str]:
+        """
+        Fetch the CTag to check cached listings of the given kinds against.
+
+        The PROPFIND is skipped when none of the kinds has a cached listing,
+        since there would be nothing to reuse.
 
         Args:
-            caldav_event: CalDAV event object
+            *kinds: Object kinds (event, journal or todo)
 
         Returns:
-            Event object
+            Tag string, or None if nothing is cached or the server has no tag
         """
-        # Extract event properties by walking through components
-        event_data = {
-            "id": caldav_event.id,
-            "title": "",
-            "description": "",
-            "start_time": None,
-            "end_time": None,
-            "location": "",
-            "status": "",
-            "attendees": [],
-            "rrule": None,
-        }
+        with self._listings_lock:
+            if not any(kind in self._listings for kind in kinds):
+                return None
+        return self._collection_tag(self._calendar)
 
-        # Walk through components to find VEVENT
-        for component in caldav_event.icalendar_instance.walk():
-            if component.name == "VEVENT":
-                event_data["title"] = str(component.get("summary", ""))
-                event_data["description"] = str(component.get("description", ""))
-
-                # Handle date/time values
-                dtstart = component.get("dtstart")
-                if dtstart:
-                    event_data["start_time"] = dtstart.dt
-
-                dtend = component.get("dtend")
-                if dtend:
-                    event_data["end_time"] = dtend.dt
-
-                event_data["location"] = str(component.get("location", ""))
-                event_data["status"] = str(component.get("status", ""))
-
-                # Handle attendees
-                attendees = component.get("attendee", [])
-                if attendees:
-                    if isinstance(attendees, list):
-                        event_data["attendees"] = [str(a) for a in attendees]
-                    else:
-                        event_data["attendees"] = [str(attendees)]
-
-                # Handle recurrence rule
-                rrule = component.get("rrule")
-                if rrule:
-                    event_data["rrule"] = rrule
-
-                # Ensure ID is set from UID if missing
-                if not event_data["id"]:
-                    uid = component.get("uid")
-                    if uid:
-                        event_data["id"] = str(uid)
-
-                break  # We only need the first VEVENT
-
-        # Create Event object from the extracted data
-        event_obj = Event(
-            title=event_data["title"],
-            description=event_data["description"],
-            start_time=event_data["start_time"],
-            end_time=event_data["end_time"],
-            location=event_data["location"],
-            attendees=event_data["attendees"],
-            status=event_data["status"],
-            rrule=event_data.get("rrule"),
-        )
-        event_obj.id = event_data["id"]
-        return event_obj
+    @require_connected
+    def list_kind(self, kind: str, ctag: Optional[str] = _PROBE) -> list:
+        """
+        Retrieve every object of one kind, converted.
+
+        Each kind is fetched with its own comp-filter, since nested
+        comp-filters are ANDed (RFC 4791 section 9.7.1). The previous listing
+        is reused while the collection tag is unchanged; callers listing
+        several kinds can probe the tag once with listing_tag() and pass it in.
+
+        Args:
+            kind: Object kind (event, journal or todo)
+            ctag: Collection tag from listing_tag(); probed when omitted
+
+        Returns:
+            List of Event or Todo objects, or journal dictionaries
+        """
+        if ctag is _PROBE:
+            ctag = self.listing_tag(kind)
+        with self._listings_lock:
+            cached = self._listings.get(kind)
+        if ctag and cached is not None and cached[0] == ctag:
+            # Hand out copies so callers cannot alter the cached listing
+            return copy.deepcopy(cached[1])
+
+        convert = getattr(self, f"_convert_caldav_{kind}")
+        values = []
+        for obj in self._list_objects(kind, None, None):
+            value = convert(obj)
+            obj_id = value["id"] if isinstance(value, dict) else value.id
+            if obj_id:
+                self._hrefs[obj_id] = str(obj.url)
+            values.append(value)
+
+        # A listing fetched without a tag is stored unmatched, so the next
+        # call probes the tag and refetches once before hits can start
+        with self._listings_lock:
+            self._listings[kind] = (ctag, copy.deepcopy(values))
+        return values
+
+    @require_connected
+    def iter_events(
+        self, start_date: Optional[str] = None, end_date: Optional[str] = None
+    ) -> Iterator[Event]:
+        """
+        Retrieve events lazily from the CalDAV server.
+
+        The REPORT runs immediately; for time-range queries each Event is only
+        built as the returned iterator is consumed, so callers can convert and
+        drop them one at a time.
+
+        Args:
+            start_date: Optional start date filter (ISO format)
+            end_date: Optional end date filter (ISO format)
+
+        Returns:
+            Iterator over Event objects
+        """
+        try:
+            if not (start_date or end_date):
+                events = self.list_kind("event")
+                logger.info("Retrieved %s events", len(events))
+                return iter(events)
+            events = self._list_objects("event", start_date, end_date)
+            logger.info("Retrieved %s events", len(events))
+            return map(self._convert_caldav_event, events)
+        except Exception as e:
+            logger.error("Failed to retrieve events: %s", e)
+            raise  # Propagate the exception
 
     def get_events(
         self, start_date: Optional[str] = None, end_date: Optional[str] = None
@@ -651,35 +1188,37 @@ class CalDAVClient:
             end_date: Optional end date filter (ISO format)
 
         Returns:
-            List of Event objects or empty list if failed
+            List of Event objects
         """
-        if not self.connected:
-            logger.error("Not connected to the calendar")
-            raise Exception("Not connected to the calendar")
+        return list(self.iter_events(start_date, end_date))
 
-        try:
-            # Get the principal and calendar
-            principal = self.client.principal()
-            calendar = principal.calendars()[0]  # Use first calendar
-
-            # Fetch events from the calendar
-            if start_date and end_date:
-                # Filter by date range
-                events = calendar.events(start=start_date, end=end_date)
-            else:
-                # Get all events
-                events = calendar.events()
+    @require_connected
+    def iter_todos(
+        self, start_date: Optional[str] = None, end_date: Optional[str] = None
+    ) -> Iterator[Todo]:
+        """
+        Retrieve todos lazily from the CalDAV server.
 
-            # Convert events to list of Event objects
-            event_list = []
-            for event in events:
-                event_list.append(self._convert_caldav_event(event))
+        The REPORT runs immediately; for time-range queries each Todo is only
+        built as the returned iterator is consumed.
 
-            logger.info(f"Retrieved {len(event_list)} events")
-            return event_list
+        Args:
+            start_date: Optional start date filter (ISO format)
+            end_date: Optional end date filter (ISO format)
 
+        Returns:
+            Iterator over Todo objects
+        """
+        try:
+            if not (start_date or end_date):
+                todos = self.list_kind("todo")
+                logger.info("Retrieved %s todos", len(todos))
+                return iter(todos)
+            todos = self._list_objects("todo", start_date, end_date)
+            logger.info("Retrieved %s todos", len(todos))
+            return map(self._convert_caldav_todo, todos)
         except Exception as e:
-            logger.error(f"Failed to retrieve events: {e}")
+            logger.error("Failed to retrieve todos: %s", e)
             raise  # Propagate the exception
 
     def get_todos(
@@ -693,86 +1232,11 @@ class CalDAVClient:
             end_date: Optional end date filter (ISO format)
 
         Returns:
-            List of Todo objects or empty list if failed
+            List of Todo objects
         """
-        if not self.connected:
-            logger.error("Not connected to the calendar")
-            raise Exception("Not connected to the calendar")
+        return list(self.iter_todos(start_date, end_date))
 
-        try:
-            # Get the principal and calendar
-            principal = self.client.principal()
-            calendar = principal.calendars()[0]  # Use first calendar
-
-            # Fetch todos from the calendar
-            if start_date and end_date:
-                # Filter by date range
-                todos = calendar.todos(start=start_date, end=end_date)
-            else:
-                # Get all todos
-                todos = calendar.todos()
-
-            # Convert todos to list of Todo objects
-            todo_list = []
-            for todo in todos:
-                # Extract todo properties by walking through components
-                todo_data = {
-                    "id": todo.id,
-                    "title": "",
-                    "description": "",
-                    "priority": 5,
-                    "status": "",
-                    "due_date": None,
-                    "completion_date": None,
-                }
-
-                # Walk through components to find VTODO
-                for component in todo.icalendar_instance.walk():
-                    if component.name == "VTODO":
-                        todo_data["title"] = str(component.get("summary", ""))
-                        todo_data["description"] = str(component.get("description", ""))
-
-                        # Handle priority
-                        priority = component.get("priority")
-                        if priority:
-                            todo_data["priority"] = int(priority)
-
-                        todo_data["status"] = str(component.get("status", ""))
-
-                        # Handle date/time values
-                        due = component.get("due")
-                        if due:
-                            todo_data["due_date"] = due.dt
-
-                        completed = component.get("completed")
-                        if completed:
-                            todo_data["completion_date"] = completed.dt
-                        # Fallback to UID if ID not set
-                        if not todo_data["id"]:
-                            uid = component.get("uid")
-                            if uid:
-                                todo_data["id"] = str(uid)
-                        break  # We only need the first VTODO
-
-                # Create Todo object from the extracted data
-                todo_obj = Todo(
-                    title=todo_data["title"],
-                    description=todo_data["description"],
-                    due_date=todo_data["due_date"],
-                    completion_date=todo_data["completion_date"],
-                    status=todo_data["status"],
-                    priority=todo_data["priority"],
-                )
-                todo_obj.id = todo_data["id"]
-                todo_list.append(todo_obj)
-
-            logger.info(f"Retrieved {len(todo_list)} todos")
-            return todo_list
-    
-        except Exception as e:
-            logger.error(f"Failed to retrieve todos: {e}")
-            raise  # Propagate the exception
-    
+    @require_connected
     def get_journals(
         self, start_date: Optional[str] = None, end_date: Optional[str] = None
     ) -> list:
@@ -786,29 +1250,60 @@ class CalDAVClient:
         Returns:
             List of journal dictionaries or empty list if failed
         """
-        if not self.connected:
-            logger.error("Not connected to the calendar")
-            raise Exception("Not connected to the calendar")
-
         try:
-            # Get the principal and calendar
-            principal = self.client.principal()
-            calendar = principal.calendars()[0]  # Use first calendar
-
-            # Fetch journals from the calendar
-            if start_date and end_date:
-                journals = calendar.journals(start=start_date, end=end_date)
+            if not (start_date or end_date):
+                journal_list = self.list_kind("journal")
             else:
-                journals = calendar.journals()
+                journals = self._list_objects("journal", start_date, end_date)
 
-            journal_list = []
-            for journal in journals:
-                # Use existing read_journal to get dict representation
-                journal_data = self.read_journal(journal.id)
-                journal_list.append(journal_data)
+                # The query REPORT already carries each journal's data; convert
+                # it in place instead of fetching every journal again
+                journal_list = [self._convert_caldav_journal(j) for j in journals]
 
-            logger.info(f"Retrieved {len(journal_list)} journals")
+            logger.info("Retrieved %s journals", len(journal_list))
             return journal_list
         except Exception as e:
-            logger.error(f"Failed to retrieve journals: {e}")
+            logger.error("Failed to retrieve journals: %s", e)
+            raise  # Propagate the exception
+
+    @require_connected
+    def sync(self, calendar_url: Optional[str] = None) -> Tuple[str, List[Dict]]:
+        """
+        Fetch the objects changed since the previous sync (RFC 6578).
+
+        The first call for a calendar returns every object; later calls
+        return only the delta reported by the server's sync-collection REPORT.
+
+        Args:
+            calendar_url: Calendar to sync; defaults to the connected calendar
+
+        Returns:
+            Tuple of (new sync token, list of dicts with href and etag)
+        """
+        try:
+            # Resolve the calendar to sync
+            if calendar_url:
+                calendar = self._client.calendar(url=calendar_url)
+            else:
+                calendar = self._calendar
+
+            key = str(calendar.url)
+            updates = calendar.objects_by_sync_token(
+                sync_token=self._sync_tokens.get(key), load_objects=False
+            )
+
+            changes = []
+            for obj in updates:
+                href = str(obj.url)
+                self._cache.invalidate(href_to_id(href))
+                self._raw.invalidate(href_to_id(href))
+                changes.append(
+                    {"href": href, "etag": obj.props.get("{DAV:}getetag")}
+                )
+            self._sync_tokens[key] = updates.sync_token
+
+            logger.info("Synced %s changed objects", len(changes))
+            return updates.sync_token, changes
+        except Exception as e:
+            logger.error("Failed to sync calendar: %s", e)
             raise  # Propagate the exception
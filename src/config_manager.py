@@ -3,17 +3,76 @@ Configuration Manager for MCP CalDAV Application
 Handles loading and managing application configuration.
 """
 
+import functools
 import os
 import json
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Parsed settings files keyed by path, with the (mtime_ns, size) they were
+# parsed at; ConfigManagers created while a file is unchanged skip the parse
+_FILE_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON from bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _read_config_file(path: str, st: os.stat_result) -> Dict[str, Any]:
+    """
+    Parse a settings file, reusing the previous result if it is unchanged.
+
+    Args:
+        path: Path to the configuration file
+        st: Result of os.stat() on the file
+
+    Returns:
+        Parsed settings; callers must copy it before modifying it
+    """
+    cached = _FILE_CACHE.get(path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+
+    with open(path, "rb") as f:
+        file_config = _loads(f.read())
+    _FILE_CACHE[path] = (st.st_mtime_ns, st.st_size, file_config)
+    return file_config
+
 
 class ConfigManager:
     """Manages application configuration from multiple sources."""
 
+    # (environment variable, config key, converter) for each overridable setting
+    _ENV_MAP = (
+        # CalDAV server settings
+        ("CALDAV_SERVER_URL", "server_url", str),
+        ("CALDAV_USERNAME", "username", str),
+        ("CALDAV_PASSWORD", "password", str),
+        ("CALDAV_USE_SSL", "use_ssl", lambda value: value.lower() == "true"),
+        ("CALDAV_CALENDAR_URL", "calendar_url", str),
+        ("CALDAV_READ_CACHE_TTL", "read_cache_ttl", float),
+        ("CALDAV_PROBE_TIMEOUT", "probe_timeout", float),
+        # Logging settings
+        ("LOG_LEVEL", "log_level", str),
+    )
+
     def __init__(self, config_file: str = "config/settings.json"):
         """
         Initialize the configuration manager.
@@ -34,14 +93,16 @@ class ConfigManager:
         config = {}
 
         # Load from file if it exists
-        if os.path.exists(self.config_file):
+        try:
+            st = os.stat(self.config_file)
+        except OSError:
+            st = None
+        if st is not None:
             try:
-                with open(self.config_file, "r") as f:
-                    file_config = json.load(f)
-                    config.update(file_config)
-                logger.info(f"Loaded configuration from {self.config_file}")
+                config.update(_read_config_file(self.config_file, st))
+                logger.info("Loaded configuration from %s", self.config_file)
             except Exception as e:
-                logger.warning(f"Failed to load configuration from file: {e}")
+                logger.warning("Failed to load configuration from file: %s", e)
 
         # Override with environment variables
         env_config = self._load_from_env()
@@ -50,6 +111,12 @@ class ConfigManager:
         # Set defaults if not provided
         self._set_defaults(config)
 
+        # Relative hrefs are joined onto the calendar URL, which only keeps
+        # its last segment when it names a collection, i.e. ends with "/"
+        calendar_url = config.get("calendar_url")
+        if calendar_url and not calendar_url.endswith("/"):
+            config["calendar_url"] = calendar_url + "/"
+
         return config
 
     def _load_from_env(self) -> Dict[str, Any]:
@@ -59,23 +126,18 @@ class ConfigManager:
         Returns:
             Dictionary with environment variable configurations
         """
-        config = {}
-
-        # CalDAV server settings
-        if "CALDAV_SERVER_URL" in os.environ:
-            config["server_url"] = os.environ["CALDAV_SERVER_URL"]
-        if "CALDAV_USERNAME" in os.environ:
-            config["username"] = os.environ["CALDAV_USERNAME"]
-        if "CALDAV_PASSWORD" in os.environ:
-            config["password"] = os.environ["CALDAV_PASSWORD"]
-        if "CALDAV_USE_SSL" in os.environ:
-            config["use_ssl"] = os.environ["CALDAV_USE_SSL"].lower() == "true"
-
-        # Logging settings
-        if "LOG_LEVEL" in os.environ:
-            config["log_level"] = os.environ["LOG_LEVEL"]
-
-        return config
+        getenv = os.environ.get
+        env_config = {}
+        for name, key, convert in self._ENV_MAP:
+            value = getenv(name)
+            if value is None:
+                continue
+            try:
+                env_config[key] = convert(value)
+            except ValueError:
+                # Leave the setting to the file or the default
+                logger.warning("Ignoring invalid %s value: %r", name, value)
+        return env_config
 
     def _set_defaults(self, config: Dict[str, Any]) -> None:
         """
@@ -94,6 +156,10 @@ class ConfigManager:
             config["use_ssl"] = True
         if "log_level" not in config:
             config["log_level"] = "INFO"
+        if "read_cache_ttl" not in config:
+            config["read_cache_ttl"] = 0.0
+        if "probe_timeout" not in config:
+            config["probe_timeout"] = 5.0
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -124,8 +190,22 @@ class ConfigManager:
         """
         try:
             os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
-            with open(self.config_file, "w") as f:
-                json.dump(self.config, f, indent=2)
-            logger.info(f"Saved configuration to {self.config_file}")
+            with open(self.config_file, "wb") as f:
+                f.write(_dumps(self.config))
+            logger.info("Saved configuration to %s", self.config_file)
         except Exception as e:
-            logger.error(f"Failed to save configuration: {e}")
+            logger.error("Failed to save configuration: %s", e)
+
+
+@functools.lru_cache(maxsize=None)
+def get_config(config_file: str = "config/settings.json") -> ConfigManager:
+    """
+    Return the process-wide ConfigManager for a settings file.
+
+    Args:
+        config_file: Path to the configuration file
+
+    Returns:
+        Shared ConfigManager instance
+    """
+    return ConfigManager(config_file)
@@ -40,7 +40,7 @@ class ErrorHandler:
         }
 
         # Log the error
-        logger.error(f"Error in {method}: {exception}", exc_info=True)
+        logger.error("Error in %s: %s", method, exception, exc_info=True)
 
         return error_info
 
@@ -59,12 +59,11 @@ class ErrorHandler:
         Returns:
             Dictionary containing error response in MCP format
         """
-        response = {"jsonrpc": "2.0", "error": {"code": error_code, "message": message}}
-
+        error = {"code": error_code, "message": message}
         if data:
-            response["error"]["data"] = data
+            error["data"] = data
 
-        return response
+        return {"jsonrpc": "2.0", "error": error}
 
     @staticmethod
     def create_success_response(result: Dict[str, Any]) -> Dict[str, Any]:
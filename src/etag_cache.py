@@ -0,0 +1,106 @@
+"""
+ETag Cache for MCP CalDAV Application
+Keeps recently read calendar objects alongside their ETag so unchanged
+items can be revalidated with a conditional GET instead of re-downloaded.
+"""
+
+import copy
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+class ETagCache:
+    """
+    Size-bounded LRU mapping of object ID to (etag, parsed value).
+
+    Values are copied on the way in and on every hit, so callers that
+    mutate a stored or returned object cannot alter the cached entry.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 0.0):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept before evicting the oldest
+            ttl: Seconds an entry is served by get_fresh() without revalidation
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+        # time.monotonic() of each entry's last store or revalidation
+        self._checked: Dict[str, float] = {}
+
+    def get(self, key: str) -> Optional[Tuple[str, Any]]:
+        """
+        Look up a cached entry and mark it as recently used.
+
+        Args:
+            key: Object ID
+
+        Returns:
+            Tuple of (etag, copy of the value) or None if not cached
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0], copy.deepcopy(entry[1])
+
+    def get_fresh(self, key: str) -> Optional[Any]:
+        """
+        Return a copy of a cached value confirmed within the last ttl seconds.
+
+        Args:
+            key: Object ID
+
+        Returns:
+            Cached value, or None if missing or due for revalidation
+        """
+        checked = self._checked.get(key)
+        if checked is None or time.monotonic() - checked >= self.ttl:
+            return None
+        entry = self.get(key)
+        return entry[1] if entry is not None else None
+
+    def touch(self, key: str) -> None:
+        """
+        Record that an entry was just revalidated against the server.
+
+        Args:
+            key: Object ID
+        """
+        if key in self._entries:
+            self._checked[key] = time.monotonic()
+
+    def put(self, key: str, etag: str, value: Any) -> None:
+        """
+        Store an entry, evicting the least recently used one if full.
+
+        Args:
+            key: Object ID
+            etag: ETag returned by the server for the object
+            value: Parsed representation of the object
+        """
+        self._entries[key] = (etag, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        self._checked[key] = time.monotonic()
+        if len(self._entries) > self.maxsize:
+            evicted, _ = self._entries.popitem(last=False)
+            self._checked.pop(evicted, None)
+
+    def invalidate(self, key: str) -> None:
+        """
+        Drop an entry if present.
+
+        Args:
+            key: Object ID
+        """
+        self._entries.pop(key, None)
+        self._checked.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+        self._checked.clear()
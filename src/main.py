@@ -7,8 +7,7 @@ that supports CRUD operations on events, journals, and todos.
 
 import sys
 import logging
-from stdio_interface import StdioInterface
-from config_manager import ConfigManager
+from config_manager import get_config
 
 # Configure logging
 logging.basicConfig(
@@ -23,9 +22,11 @@ def main():
 
     try:
         # Initialize configuration manager
-        config_manager = ConfigManager()
+        config_manager = get_config()
 
         # Initialize STDIO interface
+        from stdio_interface import StdioInterface
+
         stdio_interface = StdioInterface(config_manager)
 
         # Start the STDIO loop
@@ -35,7 +36,7 @@ def main():
         logger.info("Application interrupted by user")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Application error: {str(e)}")
+        logger.error("Application error: %s", e)
         sys.exit(1)
 
 
@@ -4,12 +4,101 @@ Provides common functionality for all data models.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from datetime import datetime
+from typing import Dict, Any, Iterator, Optional
+import os
+import sys
+import threading
 import uuid
 
+# Shared default for list fields left empty; never mutated in place
+EMPTY: tuple = ()
+
+# RFC 5545 STATUS values, interned so parsed objects share one copy of each
+STATUSES = {
+    status: sys.intern(status)
+    for status in (
+        "TENTATIVE",
+        "CONFIRMED",
+        "CANCELLED",
+        "NEEDS-ACTION",
+        "COMPLETED",
+        "IN-PROCESS",
+        "DRAFT",
+        "FINAL",
+    )
+}
+
+_fromisoformat = datetime.fromisoformat
+
+# Random bytes drawn per urandom call when minting object IDs
+_ID_POOL_SIZE = 4096
+
+
+def _uuid4_strings() -> Iterator[str]:
+    """Yield random (version 4) UUID strings from a pooled urandom buffer."""
+    while True:
+        pool = os.urandom(_ID_POOL_SIZE)
+        for offset in range(0, _ID_POOL_SIZE, 16):
+            yield str(uuid.UUID(bytes=pool[offset : offset + 16], version=4))
+
+
+_next_id = _uuid4_strings().__next__
+_id_lock = threading.Lock()
+
+
+def new_id() -> str:
+    """
+    Mint a random (version 4) UUID string.
+
+    Safe to call from worker threads; the shared pool is advanced under a lock.
+
+    Returns:
+        UUID string
+    """
+    with _id_lock:
+        return _next_id()
+
+
+def intern_status(value: Any) -> str:
+    """
+    Convert a STATUS value to text, reusing the interned copy when known.
+
+    Args:
+        value: Status value (string or icalendar vText)
+
+    Returns:
+        Status string
+    """
+    text = str(value)
+    return STATUSES.get(text, text)
+
+
+def parse_datetime(value: Any) -> Optional[datetime]:
+    """
+    Parse an ISO 8601 string, mapping empty values to None.
+
+    Datetimes, as emitted by to_dict, are passed through unchanged.
+
+    Args:
+        value: ISO 8601 string, datetime or None
+
+    Returns:
+        Parsed datetime or None
+    """
+    if not value or isinstance(value, datetime):
+        return value or None
+    return _fromisoformat(value)
+
 
 class BaseModel(ABC):
-    """Abstract base class for all data models."""
+    """Abstract base class for all data models.
+
+    Models declare their fields in ``__slots__`` so instances carry no
+    per-object ``__dict__``; keyword properties must name a declared slot.
+    """
+
+    __slots__ = ("id",)
 
     def __init__(self, **kwargs):
         """
@@ -19,10 +108,7 @@ class BaseModel(ABC):
             **kwargs: Model properties
         """
         # Generate unique ID if not provided
-        if "id" not in kwargs or not kwargs["id"]:
-            self.id = str(uuid.uuid4())
-        else:
-            self.id = kwargs["id"]
+        self.id = kwargs.get("id") or new_id()
 
         # Set other properties
         for key, value in kwargs.items():
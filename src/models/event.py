@@ -3,14 +3,48 @@ Event Model for MCP CalDAV Application
 Represents calendar events with all relevant properties.
 """
 
+import operator
 from typing import Dict, Any, List
 from datetime import datetime
-from models.base_model import BaseModel
+from models.base_model import EMPTY, BaseModel, intern_status, parse_datetime
+from models.ical_format import content_lines, date_line, format_recur, utc_stamp
 
 
 class Event(BaseModel):
     """Model representing a calendar event."""
 
+    __slots__ = (
+        "title",
+        "description",
+        "start_time",
+        "end_time",
+        "location",
+        "attendees",
+        "categories",
+        "status",
+        "priority",
+        "url",
+        "vevent",
+        "rrule",
+    )
+
+    # to_dict keys, read in one C-level call by _GET_FIELDS
+    _FIELDS = (
+        "id",
+        "title",
+        "description",
+        "start_time",
+        "end_time",
+        "location",
+        "attendees",
+        "categories",
+        "status",
+        "priority",
+        "url",
+        "rrule",
+    )
+    _GET_FIELDS = operator.attrgetter(*_FIELDS)
+
     def __init__(
         self,
         title: str = "",
@@ -50,8 +84,8 @@ class Event(BaseModel):
         self.start_time = start_time
         self.end_time = end_time
         self.location = location
-        self.attendees = attendees or []
-        self.categories = categories or []
+        self.attendees = attendees or EMPTY
+        self.categories = categories or EMPTY
         self.status = status
         self.priority = priority
         self.url = url
@@ -65,20 +99,7 @@ class Event(BaseModel):
         Returns:
             Dictionary representation of the event
         """
-        return {
-            "id": self.id,
-            "title": self.title,
-            "description": self.description,
-            "start_time": self.start_time,
-            "end_time": self.end_time,
-            "location": self.location,
-            "attendees": self.attendees,
-            "categories": self.categories,
-            "status": self.status,
-            "priority": self.priority,
-            "url": self.url,
-            "rrule": self.rrule,
-        }
+        return dict(zip(self._FIELDS, self._GET_FIELDS(self)))
 
     def from_dict(self, data: Dict[str, Any]) -> None:
         """
@@ -87,30 +108,21 @@ class Event(BaseModel):
         Args:
             data: Dictionary containing event data
         """
-        self.id = data.get("id", self.id)
-        self.title = data.get("title", "")
-        self.description = data.get("description", "")
-        self.location = data.get("location", "")
-        self.attendees = data.get("attendees", [])
-        self.categories = data.get("categories", [])
-        self.status = data.get("status", "CONFIRMED")
-        self.priority = data.get("priority", 5)
-        self.url = data.get("url", "")
-        self.vevent = data.get("vevent", None)
-        self.rrule = data.get("rrule", None)
-
-        # Handle datetime conversion
-        start_time_str = data.get("start_time")
-        if start_time_str:
-            self.start_time = datetime.fromisoformat(start_time_str)
-        else:
-            self.start_time = None
-
-        end_time_str = data.get("end_time")
-        if end_time_str:
-            self.end_time = datetime.fromisoformat(end_time_str)
-        else:
-            self.end_time = None
+        get = data.get
+        self.id = get("id", self.id)
+        self.title = get("title", "")
+        self.description = get("description", "")
+        self.location = get("location", "")
+        self.attendees = get("attendees", EMPTY)
+        self.categories = get("categories", EMPTY)
+        self.status = intern_status(get("status", "CONFIRMED"))
+        self.priority = get("priority", 5)
+        self.url = get("url", "")
+        self.vevent = get("vevent", None)
+        self.rrule = get("rrule", None)
+
+        self.start_time = parse_datetime(get("start_time"))
+        self.end_time = parse_datetime(get("end_time"))
 
     def to_ical(self) -> str:
         """
@@ -121,21 +133,26 @@ class Event(BaseModel):
         """
         # This is a simplified implementation
         # In a real implementation, this would use the caldav library properly
-        ical = "BEGIN:VEVENT\n"
-        ical += f"UID:{self.id}\n"
-        ical += f"SUMMARY:{self.title}\n"
-        ical += f"DESCRIPTION:{self.description}\n"
+        parts = [
+            f"BEGIN:VEVENT\r\nUID:{self.id}\r\nDTSTAMP:{utc_stamp()}\r\n",
+            content_lines((("SUMMARY", self.title), ("DESCRIPTION", self.description))),
+        ]
         if self.start_time:
-            ical += f"DTSTART:{self.start_time.strftime('%Y%m%dT%H%M%S')}\n"
+            parts.append(date_line("DTSTART", self.start_time))
         if self.end_time:
-            ical += f"DTEND:{self.end_time.strftime('%Y%m%dT%H%M%S')}\n"
-        ical += f"LOCATION:{self.location}\n"
-        ical += f"STATUS:{self.status}\n"
-        ical += f"PRIORITY:{self.priority}\n"
+            parts.append(date_line("DTEND", self.end_time))
+        parts.append(content_lines((("LOCATION", self.location),)))
+        for attendee in self.attendees:
+            parts.append(f"ATTENDEE:mailto:{attendee}\r\n")
+        if self.rrule:
+            parts.append(f"RRULE:{format_recur(self.rrule)}\r\n")
+        if self.status:
+            parts.append(f"STATUS:{self.status}\r\n")
+        parts.append(f"PRIORITY:{self.priority}\r\n")
         if self.url:
-            ical += f"URL:{self.url}\n"
-        ical += "END:VEVENT\n"
-        return ical
+            parts.append(f"URL:{self.url}\r\n")
+        parts.append("END:VEVENT\r\n")
+        return "".join(parts)
 
     def from_ical(self, ical_str: str) -> None:
         """
@@ -155,8 +172,4 @@ class Event(BaseModel):
         Returns:
             True if valid, False otherwise
         """
-        if not self.title:
-            return False
-        if self.priority < 1 or self.priority > 9:
-            return False
-        return True
+        return bool(self.title) and 1 <= self.priority <= 9
@@ -0,0 +1,180 @@
+"""
+iCalendar content-line formatting for MCP CalDAV Application
+Escapes and folds property values per RFC 5545 in a single pass.
+"""
+
+from datetime import date, datetime, time, timezone
+from typing import Any, Dict, Iterable, Tuple
+
+# RFC 5545 section 3.3.11 TEXT escapes
+_TEXT_ESCAPES = str.maketrans(
+    {"\\": "\\\\", ";": "\\;", ",": "\\,", "\n": "\\n", "\r": ""}
+)
+
+# Lines longer than 75 octets must be folded (RFC 5545 section 3.1)
+_FOLD_OCTETS = 75
+
+# Content lines end in CRLF (RFC 5545 section 3.1)
+_CALENDAR_TEMPLATE = (
+    "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//radicale-mcp//EN\r\n"
+    "{body}END:VCALENDAR\r\n"
+)
+
+
+def escape_text(value: str) -> str:
+    """
+    Escape a TEXT property value.
+
+    Args:
+        value: Raw property value
+
+    Returns:
+        Escaped value
+    """
+    return value.translate(_TEXT_ESCAPES)
+
+
+def fold_line(line: str) -> str:
+    """
+    Fold a content line at 75 octets without splitting UTF-8 sequences.
+
+    Args:
+        line: Unfolded content line, without line terminator
+
+    Returns:
+        Folded content line terminated by CRLF
+    """
+    if len(line) <= _FOLD_OCTETS and line.isascii():
+        return line + "\r\n"
+
+    parts = []
+    current = ""
+    size = 0
+    limit = _FOLD_OCTETS
+    for char in line:
+        char_size = len(char.encode("utf-8"))
+        if size + char_size > limit:
+            parts.append(current)
+            current = ""
+            size = 0
+            limit = _FOLD_OCTETS - 1  # continuation lines start with a space
+        current += char
+        size += char_size
+    parts.append(current)
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def format_floating(value: datetime) -> str:
+    """
+    Format the wall-clock fields of a datetime as a basic DATE-TIME.
+
+    Reads the fields directly rather than going through strftime's
+    locale-aware format parser.
+
+    Args:
+        value: Datetime to format; any tzinfo is ignored
+
+    Returns:
+        YYYYMMDDTHHMMSS string
+    """
+    return (
+        f"{value.year:04d}{value.month:02d}{value.day:02d}"
+        f"T{value.hour:02d}{value.minute:02d}{value.second:02d}"
+    )
+
+
+def format_datetime(value: date) -> str:
+    """
+    Format a DATE-TIME value; aware datetimes are written in UTC.
+
+    A date without a time is written as floating midnight, for properties
+    such as COMPLETED that only accept DATE-TIME.
+
+    Args:
+        value: Datetime or date to format
+
+    Returns:
+        Floating local time for naive datetimes, UTC time otherwise
+    """
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time())
+    if value.tzinfo is None:
+        return format_floating(value)
+    return format_floating(value.astimezone(timezone.utc)) + "Z"
+
+
+def date_line(name: str, value: date) -> str:
+    """
+    Serialise a property that takes a DATE or DATE-TIME value.
+
+    All-day values (dates without a time) are written with VALUE=DATE.
+
+    Args:
+        name: Property name, e.g. DTSTART
+        value: Datetime or date
+
+    Returns:
+        Content line
+    """
+    if isinstance(value, datetime):
+        return f"{name}:{format_datetime(value)}\r\n"
+    return f"{name};VALUE=DATE:{value.year:04d}{value.month:02d}{value.day:02d}\r\n"
+
+
+def utc_stamp() -> str:
+    """
+    Format the current time as a UTC DATE-TIME, as DTSTAMP requires.
+
+    Returns:
+        YYYYMMDDTHHMMSSZ string
+    """
+    return format_floating(datetime.now(timezone.utc)) + "Z"
+
+
+def format_recur(rule: Dict[str, Any]) -> str:
+    """
+    Format a RECUR value such as ``{"FREQ": "DAILY", "COUNT": 3}``.
+
+    Args:
+        rule: Recurrence rule parts
+
+    Returns:
+        Recurrence rule string
+    """
+    return ";".join(
+        f"{name.upper()}="
+        + (
+            ",".join(map(str, value))
+            if isinstance(value, (list, tuple))
+            else str(value)
+        )
+        for name, value in rule.items()
+    )
+
+
+def calendar_document(body: str) -> str:
+    """
+    Wrap component blocks in a VCALENDAR object.
+
+    Args:
+        body: One or more serialised components
+
+    Returns:
+        Complete iCalendar document
+    """
+    return _CALENDAR_TEMPLATE.format_map({"body": body})
+
+
+def content_lines(properties: Iterable[Tuple[str, str]]) -> str:
+    """
+    Serialise (name, text value) pairs as escaped, folded content lines.
+
+    Args:
+        properties: Property name and raw TEXT value pairs
+
+    Returns:
+        Concatenated content lines
+    """
+    return "".join(
+        fold_line(f"{name}:{escape_text(value)}") for name, value in properties
+    )
@@ -3,14 +3,39 @@ Journal Model for MCP CalDAV Application
 Represents journal entries with all relevant properties.
 """
 
+import operator
 from typing import Dict, Any, List
 from datetime import datetime
-from models.base_model import BaseModel
+from models.base_model import EMPTY, BaseModel, parse_datetime
+from models.ical_format import content_lines, date_line, utc_stamp
 
 
 class Journal(BaseModel):
     """Model representing a journal entry."""
 
+    __slots__ = (
+        "date",
+        "title",
+        "content",
+        "tags",
+        "categories",
+        "priority",
+        "url",
+    )
+
+    # to_dict keys, read in one C-level call by _GET_FIELDS
+    _FIELDS = (
+        "id",
+        "date",
+        "title",
+        "content",
+        "tags",
+        "categories",
+        "priority",
+        "url",
+    )
+    _GET_FIELDS = operator.attrgetter(*_FIELDS)
+
     def __init__(
         self,
         date: datetime = None,
@@ -40,8 +65,8 @@ class Journal(BaseModel):
         self.date = date
         self.title = title
         self.content = content
-        self.tags = tags or []
-        self.categories = categories or []
+        self.tags = tags or EMPTY
+        self.categories = categories or EMPTY
         self.priority = priority
         self.url = url
 
@@ -52,16 +77,7 @@ class Journal(BaseModel):
         Returns:
             Dictionary representation of the journal entry
         """
-        return {
-            "id": self.id,
-            "date": self.date.isoformat() if self.date else None,
-            "title": self.title,
-            "content": self.content,
-            "tags": self.tags,
-            "categories": self.categories,
-            "priority": self.priority,
-            "url": self.url,
-        }
+        return dict(zip(self._FIELDS, self._GET_FIELDS(self)))
 
     def from_dict(self, data: Dict[str, Any]) -> None:
         """
@@ -70,20 +86,16 @@ class Journal(BaseModel):
         Args:
             data: Dictionary containing journal data
         """
-        self.id = data.get("id", self.id)
-        self.title = data.get("title", "")
-        self.content = data.get("content", "")
-        self.tags = data.get("tags", [])
-        self.categories = data.get("categories", [])
-        self.priority = data.get("priority", 5)
-        self.url = data.get("url", "")
-
-        # Handle datetime conversion
-        date_str = data.get("date")
-        if date_str:
-            self.date = datetime.fromisoformat(date_str)
-        else:
-            self.date = None
+        get = data.get
+        self.id = get("id", self.id)
+        self.title = get("title", "")
+        self.content = get("content", "")
+        self.tags = get("tags", EMPTY)
+        self.categories = get("categories", EMPTY)
+        self.priority = get("priority", 5)
+        self.url = get("url", "")
+
+        self.date = parse_datetime(get("date"))
 
     def to_ical(self) -> str:
         """
@@ -94,17 +106,17 @@ class Journal(BaseModel):
         """
         # This is a simplified implementation
         # In a real implementation, this would use the caldav library properly
-        ical = "BEGIN:VJOURNAL\n"
-        ical += f"UID:{self.id}\n"
-        ical += f"SUMMARY:{self.title}\n"
-        ical += f"DESCRIPTION:{self.content}\n"
+        parts = [
+            f"BEGIN:VJOURNAL\r\nUID:{self.id}\r\nDTSTAMP:{utc_stamp()}\r\n",
+            content_lines((("SUMMARY", self.title), ("DESCRIPTION", self.content))),
+        ]
         if self.date:
-            ical += f"DTSTAMP:{self.date.strftime('%Y%m%dT%H%M%S')}\n"
-        ical += f"PRIORITY:{self.priority}\n"
+            parts.append(date_line("DTSTART", self.date))
+        parts.append(f"PRIORITY:{self.priority}\r\n")
         if self.url:
-            ical += f"URL:{self.url}\n"
-        ical += "END:VJOURNAL\n"
-        return ical
+            parts.append(f"URL:{self.url}\r\n")
+        parts.append("END:VJOURNAL\r\n")
+        return "".join(parts)
 
     def from_ical(self, ical_str: str) -> None:
         """
@@ -124,8 +136,4 @@ class Journal(BaseModel):
         Returns:
             True if valid, False otherwise
         """
-        if not self.title:
-            return False
-        if self.priority < 1 or self.priority > 9:
-            return False
-        return True
+        return bool(self.title) and 1 <= self.priority <= 9
@@ -3,14 +3,43 @@ Todo Model for MCP CalDAV Application
 Represents todo items with all relevant properties.
 """
 
+import operator
 from typing import Dict, Any, List
 from datetime import datetime
-from models.base_model import BaseModel
+from models.base_model import EMPTY, BaseModel, intern_status, parse_datetime
+from models.ical_format import content_lines, date_line, format_datetime, utc_stamp
 
 
 class Todo(BaseModel):
     """Model representing a todo item."""
 
+    __slots__ = (
+        "title",
+        "description",
+        "due_date",
+        "completion_date",
+        "status",
+        "priority",
+        "categories",
+        "url",
+        "percent_complete",
+    )
+
+    # to_dict keys, read in one C-level call by _GET_FIELDS
+    _FIELDS = (
+        "id",
+        "title",
+        "description",
+        "due_date",
+        "completion_date",
+        "status",
+        "priority",
+        "categories",
+        "url",
+        "percent_complete",
+    )
+    _GET_FIELDS = operator.attrgetter(*_FIELDS)
+
     def __init__(
         self,
         title: str = "",
@@ -47,7 +76,7 @@ class Todo(BaseModel):
         self.completion_date = completion_date
         self.status = status
         self.priority = priority
-        self.categories = categories or []
+        self.categories = categories or EMPTY
         self.url = url
         self.percent_complete = percent_complete
 
@@ -58,18 +87,7 @@ class Todo(BaseModel):
         Returns:
             Dictionary representation of the todo item
         """
-        return {
-            "id": self.id,
-            "title": self.title,
-            "description": self.description,
-            "due_date": self.due_date,
-            "completion_date": self.completion_date,
-            "status": self.status,
-            "priority": self.priority,
-            "categories": self.categories,
-            "url": self.url,
-            "percent_complete": self.percent_complete,
-        }
+        return dict(zip(self._FIELDS, self._GET_FIELDS(self)))
 
     def from_dict(self, data: Dict[str, Any]) -> None:
         """
@@ -78,27 +96,18 @@ class Todo(BaseModel):
         Args:
             data: Dictionary containing todo data
         """
-        self.id = data.get("id", self.id)
-        self.title = data.get("title", "")
-        self.description = data.get("description", "")
-        self.status = data.get("status", "NEEDS-ACTION")
-        self.priority = data.get("priority", 5)
-        self.categories = data.get("categories", [])
-        self.url = data.get("url", "")
-        self.percent_complete = data.get("percent_complete", 0)
-
-        # Handle datetime conversion
-        due_date_str = data.get("due_date")
-        if due_date_str:
-            self.due_date = datetime.fromisoformat(due_date_str)
-        else:
-            self.due_date = None
-
-        completion_date_str = data.get("completion_date")
-        if completion_date_str:
-            self.completion_date = datetime.fromisoformat(completion_date_str)
-        else:
-            self.completion_date = None
+        get = data.get
+        self.id = get("id", self.id)
+        self.title = get("title", "")
+        self.description = get("description", "")
+        self.status = intern_status(get("status", "NEEDS-ACTION"))
+        self.priority = get("priority", 5)
+        self.categories = get("categories", EMPTY)
+        self.url = get("url", "")
+        self.percent_complete = get("percent_complete", 0)
+
+        self.due_date = parse_datetime(get("due_date"))
+        self.completion_date = parse_datetime(get("completion_date"))
 
     def to_ical(self) -> str:
         """
@@ -109,21 +118,22 @@ class Todo(BaseModel):
         """
         # This is a simplified implementation
         # In a real implementation, this would use the caldav library properly
-        ical = "BEGIN:VTODO\n"
-        ical += f"UID:{self.id}\n"
-        ical += f"SUMMARY:{self.title}\n"
-        ical += f"DESCRIPTION:{self.description}\n"
+        parts = [
+            f"BEGIN:VTODO\r\nUID:{self.id}\r\nDTSTAMP:{utc_stamp()}\r\n",
+            content_lines((("SUMMARY", self.title), ("DESCRIPTION", self.description))),
+        ]
         if self.due_date:
-            ical += f"DUE:{self.due_date.strftime('%Y%m%dT%H%M%S')}\n"
+            parts.append(date_line("DUE", self.due_date))
         if self.completion_date:
-            ical += f"COMPLETED:{self.completion_date.strftime('%Y%m%dT%H%M%S')}\n"
-        ical += f"STATUS:{self.status}\n"
-        ical += f"PRIORITY:{self.priority}\n"
-        ical += f"PERCENT-COMPLETE:{self.percent_complete}\n"
+            parts.append(f"COMPLETED:{format_datetime(self.completion_date)}\r\n")
+        if self.status:
+            parts.append(f"STATUS:{self.status}\r\n")
+        parts.append(f"PRIORITY:{self.priority}\r\n")
+        parts.append(f"PERCENT-COMPLETE:{self.percent_complete}\r\n")
         if self.url:
-            ical += f"URL:{self.url}\n"
-        ical += "END:VTODO\n"
-        return ical
+            parts.append(f"URL:{self.url}\r\n")
+        parts.append("END:VTODO\r\n")
+        return "".join(parts)
 
     def from_ical(self, ical_str: str) -> None:
         """
@@ -143,10 +153,8 @@ class Todo(BaseModel):
         Returns:
             True if valid, False otherwise
         """
-        if not self.title:
-            return False
-        if self.priority < 1 or self.priority > 9:
-            return False
-        if self.percent_complete < 0 or self.percent_complete > 100:
-            return False
-        return True
+        return (
+            bool(self.title)
+            and 1 <= self.priority <= 9
+            and 0 <= self.percent_complete <= 100
+        )
@@ -5,65 +5,246 @@ This demonstrates how to use the fastmcp library with the existing calendar func
 """
 
 from fastmcp import FastMCP
-from caldav_client import CalDAVClient
-from config_manager import ConfigManager
-from models.event import Event
-from models.todo import Todo
-from datetime import datetime
+import asyncio
+import contextlib
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Optional
+import functools
+import logging
 import os
 from zoneinfo import ZoneInfo
 
-# Initialize the MCP server
-mcp = FastMCP("Radicale MCP server 🚀")
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
 
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:  # optional speedup, see the "fast" extra
+    _parse_iso = datetime.fromisoformat
 
-def _parse_to_tz(dt_str: str) -> datetime:
-    """Parse ISO datetime string and convert to target timezone."""
-    dt = datetime.fromisoformat(dt_str)
-    target_tz_name = os.getenv("TIMEZONE", "America/New_York")
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=ZoneInfo(target_tz_name))
+logger = logging.getLogger(__name__)
+
+
+def _serialize_result(data: Any) -> str:
+    """Serialize a tool result, datetimes included, in a single orjson call."""
+    if isinstance(data, str):
+        return data
+    return orjson.dumps(data, default=str).decode()
 
+
+def _resolve_target_tz() -> ZoneInfo:
+    """Resolve the TIMEZONE setting, falling back to America/New_York."""
     try:
-        target_tz = ZoneInfo(target_tz_name)
+        return ZoneInfo(os.getenv("TIMEZONE", "America/New_York"))
     except Exception:
-        target_tz = ZoneInfo("America/New_York")
-    return dt.astimezone(target_tz)
+        return ZoneInfo("America/New_York")
+
+
+# Zone that naive tool timestamps are read in
+_TARGET_TZ = _resolve_target_tz()
+
+
+def _parse_to_utc(dt_str: str) -> datetime:
+    """
+    Parse ISO datetime string and normalize it to UTC.
+
+    Naive input is read as local time in the target timezone. The result is
+    written to the server as a UTC DATE-TIME without another conversion.
+    """
+    dt = _parse_iso(dt_str)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=_TARGET_TZ)
+    return dt.astimezone(timezone.utc)
+
+
+# Fixed tool responses, shared rather than rebuilt on every call
+_CONNECTED = {
+    "status": "connected",
+    "message": "Successfully connected to the calendar",
+}
+_CONNECT_FAILED = {"status": "failed", "message": "Failed to connect to the calendar"}
+_HEALTHY = {"status": "healthy", "message": "Connection to the calendar is healthy"}
+_RECONNECTED = {
+    "status": "reconnected",
+    "message": "Successfully reconnected to the calendar",
+}
+_RECONNECT_FAILED = {
+    "status": "failed",
+    "message": "Failed to reconnect to the calendar",
+}
+
+
+# FREQ values defined by RFC 5545 section 3.3.10
+_FREQUENCIES = frozenset(
+    ("SECONDLY", "MINUTELY", "HOURLY", "DAILY", "WEEKLY", "MONTHLY", "YEARLY")
+)
+
+
+def _error(action: str, exc: Exception) -> dict:
+    """Build the error result for a failed tool action."""
+    return {"error": f"Failed to {action}: {exc}"}
+
+
+@functools.lru_cache(maxsize=1)
+def _client():
+    """Build the shared CalDAV client on first use."""
+    from caldav_client import CalDAVClient
+    from config_manager import get_config
+
+    return CalDAVClient(get_config())
+
+
+# Single-flight guard for lazy connects; created on first use so that it
+# binds to the event loop FastMCP runs the tools on
+_connect_lock: Optional[asyncio.Lock] = None
+
 
+# Bumped by every reconnect, so callers that saw the same dead connection
+# reconnect it once rather than tearing down each other's replacement
+_connection_generation = 0
+
+
+def _get_connect_lock() -> asyncio.Lock:
+    """Return the lock serializing connects and disconnects, creating it lazily."""
+    global _connect_lock
+    if _connect_lock is None:
+        _connect_lock = asyncio.Lock()
+    return _connect_lock
+
+
+async def _ensure_connected(caldav_client) -> None:
+    """
+    Connect the shared client unless it is already connected.
+
+    Concurrent callers wait for a single connect instead of each opening
+    their own session.
+
+    Args:
+        caldav_client: Shared CalDAVClient instance
+    """
+    if caldav_client.is_connected():
+        return
+    async with _get_connect_lock():
+        if not caldav_client.is_connected():
+            await asyncio.to_thread(caldav_client.connect)
+
+
+async def _connect_in_background() -> None:
+    """Open the calendar connection ahead of the first tool call."""
+    try:
+        await _ensure_connected(_client())
+    except Exception as e:
+        logger.warning("Background connect failed, retrying on first use: %s", e)
+
+
+@contextlib.asynccontextmanager
+async def _lifespan(mcp: FastMCP) -> AsyncIterator[None]:
+    """
+    Connect to the calendar while the MCP handshake is still in progress.
+
+    Tool calls that arrive before the connection is up wait on the same
+    single-flight lock instead of connecting again.
+    """
+    task = asyncio.create_task(_connect_in_background())
+    try:
+        yield
+    finally:
+        task.cancel()
+
+
+async def _call(method: str, *args: Any) -> Any:
+    """
+    Run a blocking CalDAVClient method in a worker thread.
+
+    The shared client connects on first use and then stays connected, so
+    tool calls reuse its pooled session. If a pooled connection turns out to
+    be dead, the client is rebuilt and the call retried once.
+
+    Args:
+        method: Name of the CalDAVClient method
+        *args: Positional arguments for the method
+
+    Returns:
+        The method's return value
+    """
+    from requests.exceptions import ConnectionError
+
+    caldav_client = _client()
+    await _ensure_connected(caldav_client)
+    generation = _connection_generation
+    try:
+        return await asyncio.to_thread(getattr(caldav_client, method), *args)
+    except ConnectionError:
+        await _reconnect(caldav_client, generation)
+        return await asyncio.to_thread(getattr(caldav_client, method), *args)
 
-# Initialize configuration and client
-config_manager = ConfigManager()
-caldav_client = CalDAVClient(config_manager)
 
+async def _reconnect(caldav_client, generation: int) -> None:
+    """
+    Replace a dead connection, unless another caller already has.
 
-@mcp.tool
-def get_events() -> list:
+    Args:
+        caldav_client: Shared CalDAVClient instance
+        generation: _connection_generation seen before the failed call
+    """
+    global _connection_generation
+    async with _get_connect_lock():
+        if _connection_generation == generation:
+            await asyncio.to_thread(caldav_client.disconnect)
+            await asyncio.to_thread(caldav_client.connect)
+            _connection_generation += 1
+        elif not caldav_client.is_connected():
+            await asyncio.to_thread(caldav_client.connect)
+
+
+async def _fan_out(func, items: list) -> list:
+    """
+    Run a coroutine function over every item concurrently.
+
+    At most MAX_CONCURRENCY items are in flight at once. An item that
+    fails yields its exception in place of a result, so one bad entry does
+    not sink the batch.
+
+    Args:
+        func: Coroutine function taking one item
+        items: Batch items
+
+    Returns:
+        One result or exception per item, in order
+    """
+    from caldav_client import MAX_CONCURRENCY
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    async def run(item):
+        async with semaphore:
+            return await func(item)
+
+    return await asyncio.gather(*map(run, items), return_exceptions=True)
+
+
+async def get_events() -> list:
     """Get all events from the calendar."""
     try:
-        # Check if connected, if not, connect
-        if not caldav_client.is_connected():
-            success = caldav_client.connect()
-            if not success:
-                return [{"error": "Failed to connect to the calendar"}]
+        from models.event import Event
 
-        events = caldav_client.get_events()
-        return [event.to_dict() for event in events]
+        # Build each Event and its dict in turn, off the event loop, so the
+        # model objects are not all alive alongside the result
+        events = await _call("iter_events")
+        return await asyncio.to_thread(list, map(Event.to_dict, events))
     except Exception as e:
-        return [{"error": f"Failed to get events: {str(e)}"}]
+        return [_error("get events", e)]
 
 
-@mcp.tool
-def connect() -> dict:
+async def connect() -> dict:
     """Connect to the calendar."""
     try:
-        success = caldav_client.connect()
-        if success:
-            return {
-                "status": "connected",
-                "message": "Successfully connected to the calendar",
-            }
-        else:
-            return {"status": "failed", "message": "Failed to connect to the calendar"}
+        caldav_client = _client()
+        async with _get_connect_lock():
+            success = await asyncio.to_thread(caldav_client.connect)
+        return _CONNECTED if success else _CONNECT_FAILED
     except Exception as e:
         return {
             "status": "error",
@@ -71,24 +252,23 @@ def connect() -> dict:
         }
 
 
-@mcp.tool
-def reconnect() -> dict:
+async def reconnect() -> dict:
     """Reconnect to the calendar."""
+    global _connection_generation
     try:
-        # Disconnect first
-        caldav_client.disconnect()
-        # Then reconnect
-        success = caldav_client.connect()
-        if success:
-            return {
-                "status": "reconnected",
-                "message": "Successfully reconnected to the calendar",
-            }
-        else:
-            return {
-                "status": "failed",
-                "message": "Failed to reconnect to the calendar",
-            }
+        caldav_client = _client()
+        # Hold the connect lock so a lazy or background connect cannot run
+        # between the disconnect and the new connect
+        async with _get_connect_lock():
+            # Keep a working connection rather than paying for a new handshake
+            if await asyncio.to_thread(caldav_client.is_alive):
+                return _HEALTHY
+            # Disconnect first
+            await asyncio.to_thread(caldav_client.disconnect)
+            # Then reconnect
+            success = await asyncio.to_thread(caldav_client.connect)
+            _connection_generation += 1
+        return _RECONNECTED if success else _RECONNECT_FAILED
     except Exception as e:
         return {
             "status": "error",
@@ -96,35 +276,28 @@ def reconnect() -> dict:
         }
 
 
-@mcp.tool
-def create_event(title: str, start_time: str, end_time: str) -> dict:
+async def create_event(title: str, start_time: str, end_time: str) -> dict:
     """Create a new event on the calendar. Time in ISO format (e.g., '2026-01-14T02:16:17.478')"""
     try:
-        # Check if connected, if not, connect
-        if not caldav_client.is_connected():
-            success = caldav_client.connect()
-            if not success:
-                return {"error": "Failed to connect to the calendar"}
+        from models.event import Event
 
         # Convert string timestamps to datetime objects
-        start_dt = _parse_to_tz(start_time)
-        end_dt = _parse_to_tz(end_time)
+        start_dt = _parse_to_utc(start_time)
+        end_dt = _parse_to_utc(end_time)
 
         event = Event(title=title, start_time=start_dt, end_time=end_dt)
-        created_event_id = caldav_client.create_event(event)
+        created_event_id = await _call("create_event", event)
         if not created_event_id:
             return {"error": "Failed to create event"}
-        # Retrieve full Event object
-        event_obj = caldav_client.read_event(created_event_id)
-        if hasattr(event_obj, "to_dict"):
-            return event_obj.to_dict()
-        return {"id": created_event_id}
+        # The server stores the event exactly as sent, so answer from the
+        # local copy instead of reading it back
+        event.id = created_event_id
+        return event.to_dict()
     except Exception as e:
-        return {"error": f"Failed to create event: {str(e)}"}
+        return _error("create event", e)
 
 
-@mcp.tool
-def create_recurring_event(
+async def create_recurring_event(
     title: str,
     start_time: str,
     end_time: str,
@@ -134,99 +307,133 @@ def create_recurring_event(
 ) -> dict:
     """Create a recurring event on the calendar. Time in ISO format (e.g., '2026-01-14T02:16:17.478'). Frequency (YEARLY, MONTHLY, WEEKLY, DAILY). Interval between recurrences (default: 1). Number of occurrences (optional)"""
     try:
-        # Check if connected, if not, connect
-        if not caldav_client.is_connected():
-            success = caldav_client.connect()
-            if not success:
-                return {"error": "Failed to connect to the calendar"}
+        from models.event import Event
 
         # Build recurrence rule
-        rrule = {"FREQ": frequency.upper()}
+        freq = frequency.upper()
+        if freq not in _FREQUENCIES:
+            return {"error": f"Unsupported frequency: {frequency}"}
+        rrule = {"FREQ": freq}
         if interval != 1:
             rrule["INTERVAL"] = interval
         if count:
             rrule["COUNT"] = count
 
         # Parse timestamps
-        start_dt = _parse_to_tz(start_time)
-        end_dt = _parse_to_tz(end_time)
+        start_dt = _parse_to_utc(start_time)
+        end_dt = _parse_to_utc(end_time)
 
         # Create Event with recurrence rule
         event = Event(title=title, start_time=start_dt, end_time=end_dt, rrule=rrule)
-        created_event_id = caldav_client.create_event(event)
+        created_event_id = await _call("create_event", event)
         if not created_event_id:
             return {"error": "Failed to create recurring event"}
-        # Retrieve full Event object
-        event_obj = caldav_client.read_event(created_event_id)
-        if hasattr(event_obj, "to_dict"):
-            return event_obj.to_dict()
-        return {"id": created_event_id}
+        # The server stores the event exactly as sent, so answer from the
+        # local copy instead of reading it back
+        event.id = created_event_id
+        return event.to_dict()
+    except Exception as e:
+        return _error("create recurring event", e)
+
+
+async def create_events(events: list) -> list:
+    """Create several events in one call. Each item is an object with title, start_time and end_time (ISO format). Returns one result per item, in order."""
+    try:
+        from models.event import Event
+
+        async def create_one(item):
+            event = Event(
+                title=item.get("title", ""),
+                start_time=_parse_to_utc(item["start_time"]),
+                end_time=_parse_to_utc(item["end_time"]),
+            )
+            return await _call("create_event", event)
+
+        return [
+            _error("create event", outcome)
+            if isinstance(outcome, BaseException)
+            else {"id": outcome}
+            for outcome in await _fan_out(create_one, events)
+        ]
     except Exception as e:
-        return {"error": f"Failed to create recurring event: {str(e)}"}
+        return [_error("create events", e)]
 
 
-@mcp.tool
-def get_todos() -> list:
+async def get_todos() -> list:
     """Get all todos from the calendar."""
     try:
-        # Check if connected, if not, connect
-        if not caldav_client.is_connected():
-            success = caldav_client.connect()
-            if not success:
-                return [{"error": "Failed to connect to the calendar"}]
+        from models.todo import Todo
 
-        todos = caldav_client.get_todos()
-        return [todo.to_dict() for todo in todos]
+        # Build each Todo and its dict in turn, off the event loop, so the
+        # model objects are not all alive alongside the result
+        todos = await _call("iter_todos")
+        return await asyncio.to_thread(list, map(Todo.to_dict, todos))
     except Exception as e:
-        return [{"error": f"Failed to get todos: {str(e)}"}]
+        return [_error("get todos", e)]
 
 
-@mcp.tool
-def get_journals() -> list:
-    """Get all journals from the calendar."""
+async def get_all() -> dict:
+    """Get all events and todos from the calendar in one call."""
     try:
-        # Check if connected, if not, connect
-        if not caldav_client.is_connected():
-            success = caldav_client.connect()
-            if not success:
-                return [{"error": "Failed to connect to the calendar"}]
+        from models.event import Event
+        from models.todo import Todo
+
+        # Probe the collection tag once for both kinds, then run the two
+        # listings concurrently
+        ctag = await _call("listing_tag", "event", "todo")
+        events, todos = await asyncio.gather(
+            _call("list_kind", "event", ctag), _call("list_kind", "todo", ctag)
+        )
+        return {
+            "events": list(map(Event.to_dict, events)),
+            "todos": list(map(Todo.to_dict, todos)),
+        }
+    except Exception as e:
+        return _error("get events and todos", e)
+
 
-        journals = caldav_client.get_journals()
+async def get_journals() -> list:
+    """Get all journals from the calendar."""
+    try:
+        journals = await _call("get_journals")
         return journals
     except Exception as e:
-        return [{"error": f"Failed to get journals: {str(e)}"}]
+        return [_error("get journals", e)]
 
 
-# New delete_event tool
-@mcp.tool
-def delete_event(id: str) -> dict:
+async def delete_event(id: str) -> dict:
     """Delete an event from the calendar."""
     try:
-        if not caldav_client.is_connected():
-            success = caldav_client.connect()
-            if not success:
-                return {"error": "Failed to connect to the calendar"}
-        result = caldav_client.delete_event(id)
+        result = await _call("delete_event", id)
         return {"deleted": result}
     except Exception as e:
-        return {"error": f"Failed to delete event: {str(e)}"}
+        return _error("delete event", e)
 
 
-@mcp.tool
-def delete_todo(id: str) -> dict:
+async def delete_events(ids: list) -> list:
+    """Delete several events from the calendar in one call. Returns one result per ID, in order."""
+    try:
+        outcomes = await _fan_out(functools.partial(_call, "delete_event"), ids)
+        return [
+            {"id": event_id, **_error("delete event", outcome)}
+            if isinstance(outcome, BaseException)
+            else {"id": event_id, "deleted": outcome}
+            for event_id, outcome in zip(ids, outcomes)
+        ]
+    except Exception as e:
+        return [_error("delete events", e)]
+
+
+async def delete_todo(id: str) -> dict:
     """Delete a todo from the calendar."""
     try:
-        if not caldav_client.is_connected():
-            success = caldav_client.connect()
-            if not success:
-                return {"error": "Failed to connect to the calendar"}
-        result = caldav_client.delete_todo(id)
+        result = await _call("delete_todo", id)
         return {"deleted": result}
     except Exception as e:
-        return {"error": f"Failed to delete todo: {str(e)}"}
+        return _error("delete todo", e)
 
-@mcp.tool
-def create_journal(
+
+async def create_journal(
     date: str,
     title: str = "",
     content: str = "",
@@ -237,12 +444,8 @@ def create_journal(
 ) -> dict:
     """Create a new journal entry on the calendar. Dates in ISO format."""
     try:
-        if not caldav_client.is_connected():
-            success = caldav_client.connect()
-            if not success:
-                return {"error": "Failed to connect to the calendar"}
         # Parse date
-        journal_date = _parse_to_tz(date) if date else None
+        journal_date = _parse_to_utc(date) if date else None
         journal_data = {
             "date": journal_date,
             "title": title,
@@ -252,39 +455,33 @@ def create_journal(
             "priority": priority,
             "url": url,
         }
-        created_journal_id = caldav_client.create_journal(journal_data)
+        created_journal_id = await _call("create_journal", journal_data)
         return {"id": created_journal_id}
     except Exception as e:
-        return {"error": f"Failed to create journal: {str(e)}"}
+        return _error("create journal", e)
+
 
-@mcp.tool
-def delete_journal(id: str) -> dict:
+async def delete_journal(id: str) -> dict:
     """Delete a journal entry from the calendar."""
     try:
-        if not caldav_client.is_connected():
-            success = caldav_client.connect()
-            if not success:
-                return {"error": "Failed to connect to the calendar"}
-        result = caldav_client.delete_journal(id)
+        result = await _call("delete_journal", id)
         return {"deleted": result}
     except Exception as e:
-        return {"error": f"Failed to delete journal: {str(e)}"}
+        return _error("delete journal", e)
+
 
-@mcp.tool
-def get_journal(journal_id: str) -> dict:
+async def get_journal(journal_id: str) -> dict:
     """Retrieve a journal entry by its ID."""
     try:
-        if not caldav_client.is_connected():
-            success = caldav_client.connect()
-            if not success:
-                return {"error": "Failed to connect to the calendar"}
-        journal = caldav_client.read_journal(journal_id)
+        journal = await _call("read_journal", journal_id)
+        if journal is None:
+            return {"error": f"Journal not found: {journal_id}"}
         return journal
     except Exception as e:
-        return {"error": f"Failed to get journal: {str(e)}"}
+        return _error("get journal", e)
+
 
-@mcp.tool
-def create_todo(
+async def create_todo(
     title: str,
     due_date: str,
     description: str = "",
@@ -297,15 +494,11 @@ def create_todo(
 ) -> dict:
     """Create a new todo on the calendar. Time in ISO format (e.g., '2026-01-14T02:16:17.478')"""
     try:
-        # Ensure connection
-        if not caldav_client.is_connected():
-            success = caldav_client.connect()
-            if not success:
-                return {"error": "Failed to connect to the calendar"}
+        from models.todo import Todo
 
         # Parse dates if provided
-        due_dt = _parse_to_tz(due_date) if due_date else None
-        completed_dt = _parse_to_tz(completion_date) if completion_date else None
+        due_dt = _parse_to_utc(due_date) if due_date else None
+        completed_dt = _parse_to_utc(completion_date) if completion_date else None
 
         # Build Todo instance
         todo = Todo(
@@ -319,15 +512,68 @@ def create_todo(
             url=url,
             percent_complete=percent_complete,
         )
-        created_todo_id = caldav_client.create_todo(todo)
+        created_todo_id = await _call("create_todo", todo)
         return {"id": created_todo_id}
     except Exception as e:
-        return {"error": f"Failed to create todo: {str(e)}"}
+        return _error("create todo", e)
+
+
+# Tools exposed by the server, in registration order
+_TOOLS = (
+    get_events,
+    connect,
+    reconnect,
+    create_event,
+    create_recurring_event,
+    create_events,
+    get_todos,
+    get_all,
+    get_journals,
+    delete_event,
+    delete_events,
+    delete_todo,
+    create_journal,
+    delete_journal,
+    get_journal,
+    create_todo,
+)
+
+
+def register_tools(mcp: FastMCP) -> FastMCP:
+    """
+    Register the calendar tools on a FastMCP server.
+
+    Args:
+        mcp: Server to register the tools on
+
+    Returns:
+        The same server, for chaining
+    """
+    for tool in _TOOLS:
+        mcp.tool(tool)
+    return mcp
+
+
+def create_server() -> FastMCP:
+    """Build a FastMCP server with the calendar tools registered."""
+    return register_tools(
+        FastMCP(
+            "Radicale MCP server 🚀",
+            lifespan=_lifespan,
+            tool_serializer=_serialize_result if orjson is not None else None,
+        )
+    )
 
 
 def start_server():
     """Start the MCP server using STDIO transport."""
-    mcp.run()
+    try:
+        import uvloop
+    except ImportError:  # optional speedup, see the "fast" extra
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    create_server().run()
 
 
 if __name__ == "__main__":
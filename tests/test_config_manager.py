@@ -0,0 +1,33 @@
+"""Tests for ConfigManager."""
+
+from urllib.parse import urljoin
+
+from config_manager import ConfigManager
+
+
+def _config(tmp_path, monkeypatch, calendar_url):
+    monkeypatch.setenv("CALDAV_CALENDAR_URL", calendar_url)
+    return ConfigManager(str(tmp_path / "missing.json"))
+
+
+def test_calendar_url_gains_trailing_slash(tmp_path, monkeypatch):
+    config = _config(tmp_path, monkeypatch, "https://host/user/cal")
+
+    calendar_url = config.get("calendar_url")
+    assert calendar_url == "https://host/user/cal/"
+    # Object hrefs must resolve inside the calendar, not its parent
+    assert urljoin(calendar_url, "uid.ics") == "https://host/user/cal/uid.ics"
+
+
+def test_calendar_url_with_trailing_slash_is_unchanged(tmp_path, monkeypatch):
+    config = _config(tmp_path, monkeypatch, "https://host/user/cal/")
+
+    assert config.get("calendar_url") == "https://host/user/cal/"
+
+
+def test_invalid_numeric_setting_falls_back_to_default(tmp_path, monkeypatch):
+    monkeypatch.setenv("CALDAV_READ_CACHE_TTL", "soon")
+
+    config = ConfigManager(str(tmp_path / "missing.json"))
+
+    assert config.get("read_cache_ttl") == 0.0